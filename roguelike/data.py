@@ -75,6 +75,9 @@ ITEM_TEMPLATES = [
     Item('Exo-Boots',       'boots', dfn=3, char='u'),
 ]
 
+# High-tier gear (ATK or DEF 3+) handed out by vaults and hacking rewards
+RARE_ITEMS = tuple(it for it in ITEM_TEMPLATES if it.atk >= 3 or it.dfn >= 3)
+
 SHOP_STOCK = [
     # (item_template, base_price)
     (Item('Vibro-Knife',     'weapon', atk=1, char='/'),            15),
@@ -39,6 +39,14 @@ class Item:
         self.skill_req    = skill_req    # skill key required to use
         self.skill_level  = skill_level  # minimum level of that skill
 
+    def clone(self):
+        """Independent copy of this item (e.g. a fresh instance of a template).
+        Copies the attribute dict directly, so it skips __init__ and picks up
+        any field without listing them."""
+        item = Item.__new__(Item)
+        item.__dict__.update(self.__dict__)
+        return item
+
     def stat_str(self):
         if self.tool_effect:
             req = (f" [{SKILLS[self.skill_req]['name']} {self.skill_level}]"
@@ -1,16 +1,15 @@
 """Game loop and enemy AI."""
 
 import collections
-import copy
 import curses
 import random
 
 from .constants import *
 from .entities import Enemy, Terminal
 from .world import (find_path, compute_fov, make_floor, get_theme,
-                    apply_effect, tick_effects, _bresenham, ENEMY_TEMPLATES,
-                    generate_overland)
-from .data import ITEM_TEMPLATES, LORE_POOL, WIN_TERMINAL, SHOP_STOCK
+                    apply_effect, tick_effects, _ray, ENEMY_TEMPLATES,
+                    generate_overland, find_floor_cells)
+from .data import ITEM_TEMPLATES, LORE_POOL, WIN_TERMINAL, SHOP_STOCK, RARE_ITEMS
 from .lore_gen import generate_terminal
 from . import ui
 
@@ -88,8 +87,9 @@ def enemy_turn(enemies, tiles, px, py, visible, player,
 
     def _astar_step(enemy, epos):
         """Take one A* step toward player. Returns new position after step (may be same)."""
-        blocked = occupied - {epos}
-        path    = find_path(tiles, epos, player_pos, blocked)
+        # occupied is kept current for the whole turn and passed as-is: the
+        # enemy's own cell is the search start, which A* never re-enters
+        path = find_path(tiles, epos, player_pos, occupied)
         if not path:
             return epos, False  # (new_pos, attacked)
         step = path[0]
@@ -231,6 +231,8 @@ def run_site(stdscr, site, player):
                 is_final=is_final,
                 place_boss=place_boss,
             )
+        elif 'floor_cells' not in site.floors[fnum]:   # floors from older saves
+            site.floors[fnum]['floor_cells'] = find_floor_cells(site.floors[fnum]['tiles'])
         # Reset per-floor Grapple Line charge when entering a new floor
         grapple = player.equipment.get('tool')
         if grapple and grapple.tool_effect == 'grapple' and grapple.charges < grapple.max_charges:
@@ -385,7 +387,8 @@ def run_site(stdscr, site, player):
                     consumed = ui.show_hacking_interface(
                         stdscr, player, on_terminal, current_floor, explored,
                         enemies_on_map, items_on_map, special_rooms,
-                        tiles, px, py, visible, log, terminals_on_map, current_theme)
+                        tiles, px, py, visible, log, terminals_on_map, current_theme,
+                        floor_cells=floor_data['floor_cells'])
                     if consumed:
                         for msg in tick_effects(player, "You"):
                             log.appendleft(msg)
@@ -401,106 +404,27 @@ def run_site(stdscr, site, player):
                     # Remote access from anywhere on floor
                     others = [(pos, t) for pos, t in terminals_on_map.items() if not t.read]
                     if others:
-                        # Build a temporary dummy terminal to pass to show_hacking_interface
-                        # Actually, pick via remote picker directly here then open interface
-                        rpick2 = 0
-                        BOX_W2  = 62
-                        inner_w2 = BOX_W2 - 4
-                        while True:
-                            term_h2, term_w2 = stdscr.getmaxyx()
-                            pbox_h2 = 2 + 2 + len(others) + 1
-                            pbox_y2 = max(0, (term_h2 - pbox_h2) // 2)
-                            pbox_x2 = max(0, (term_w2 - BOX_W2) // 2)
-                            t_attr2  = curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD
-                            p_attr2  = curses.color_pair(COLOR_PANEL)
-                            s_attr2  = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
-
-                            def _r2row(row):
-                                try:
-                                    stdscr.addch(row, pbox_x2, curses.ACS_VLINE, t_attr2)
-                                    stdscr.addch(row, pbox_x2 + BOX_W2 - 1, curses.ACS_VLINE, t_attr2)
-                                    stdscr.addstr(row, pbox_x2 + 1, ' ' * (BOX_W2 - 2))
-                                except curses.error:
-                                    pass
-
-                            try:
-                                rtitle2 = " REMOTE ACCESS — Select Terminal "
-                                rpad2   = BOX_W2 - 2 - len(rtitle2)
-                                rleft2  = rpad2 // 2
-                                stdscr.addch(pbox_y2, pbox_x2, curses.ACS_ULCORNER, t_attr2)
-                                for bx in range(1, rleft2 + 1):
-                                    stdscr.addch(pbox_y2, pbox_x2 + bx, curses.ACS_HLINE, t_attr2)
-                                stdscr.addstr(pbox_y2, pbox_x2 + rleft2 + 1, rtitle2, t_attr2)
-                                for bx in range(rleft2 + 1 + len(rtitle2), BOX_W2 - 1):
-                                    stdscr.addch(pbox_y2, pbox_x2 + bx, curses.ACS_HLINE, t_attr2)
-                                stdscr.addch(pbox_y2, pbox_x2 + BOX_W2 - 1, curses.ACS_URCORNER, t_attr2)
-                            except curses.error:
-                                pass
-
-                            _r2row(pbox_y2 + 1)
-                            try:
-                                stdscr.addstr(pbox_y2 + 1, pbox_x2 + 2,
-                                              "W/S: select   Enter: hack   Esc: cancel"[:inner_w2 + 2],
-                                              p_attr2)
-                            except curses.error:
-                                pass
-
-                            try:
-                                stdscr.addch(pbox_y2 + 2, pbox_x2, curses.ACS_LTEE, t_attr2)
-                                for bx in range(1, BOX_W2 - 1):
-                                    stdscr.addch(pbox_y2 + 2, pbox_x2 + bx, curses.ACS_HLINE, t_attr2)
-                                stdscr.addch(pbox_y2 + 2, pbox_x2 + BOX_W2 - 1, curses.ACS_RTEE, t_attr2)
-                            except curses.error:
-                                pass
-
-                            for oi2, (opos2, ot2) in enumerate(others):
-                                orow2 = pbox_y2 + 3 + oi2
-                                _r2row(orow2)
-                                pfx2 = "  >" if oi2 == rpick2 else "   "
-                                lbl2 = f"{pfx2} {ot2.title[:inner_w2 - 1]}"
-                                a2   = s_attr2 if oi2 == rpick2 else p_attr2
-                                try:
-                                    stdscr.addstr(orow2, pbox_x2 + 2, lbl2[:inner_w2 + 2], a2)
-                                except curses.error:
-                                    pass
-
-                            pbot2 = pbox_y2 + 3 + len(others)
-                            try:
-                                stdscr.addch(pbot2, pbox_x2, curses.ACS_LLCORNER, t_attr2)
-                                for bx in range(1, BOX_W2 - 1):
-                                    stdscr.addch(pbot2, pbox_x2 + bx, curses.ACS_HLINE, t_attr2)
-                                stdscr.addch(pbot2, pbox_x2 + BOX_W2 - 1, curses.ACS_LRCORNER, t_attr2)
-                            except curses.error:
-                                pass
-
-                            stdscr.refresh()
-                            pk2 = stdscr.getch()
-
-                            if pk2 == 27:
-                                break
-                            if pk2 in (ord('w'), curses.KEY_UP):
-                                rpick2 = (rpick2 - 1) % len(others)
-                            elif pk2 in (ord('s'), curses.KEY_DOWN):
-                                rpick2 = (rpick2 + 1) % len(others)
-                            elif pk2 in (curses.KEY_ENTER, ord('\n'), ord('\r')):
-                                chosen_pos2, chosen_t2 = others[rpick2]
-                                consumed2 = ui.show_hacking_interface(
-                                    stdscr, player, chosen_t2, current_floor, explored,
-                                    enemies_on_map, items_on_map, special_rooms,
-                                    tiles, chosen_pos2[0], chosen_pos2[1], visible, log,
-                                    terminals_on_map, current_theme)
-                                if consumed2:
-                                    for msg in tick_effects(player, "You"):
-                                        log.appendleft(msg)
-                                    e_msgs = enemy_turn(enemies_on_map, tiles, px, py, visible, player,
-                                                        smoke_tiles=smoke_tiles, hazards_on_map=hazards_on_map)
-                                    for em in e_msgs:
-                                        log.appendleft(em)
-                                    if site.name == 'Erebus Station' and current_floor >= 7 and corruption > 0:
-                                        reduction = min(corruption, 30)
-                                        corruption -= reduction
-                                        log.appendleft(f"// Terminal handshake: signal suppressed -{reduction}%")
-                                break
+                        rpick2 = ui.show_remote_picker(
+                            stdscr, others, "W/S: select   Enter: hack   Esc: cancel")
+                        if rpick2 is not None:
+                            chosen_pos2, chosen_t2 = others[rpick2]
+                            consumed2 = ui.show_hacking_interface(
+                                stdscr, player, chosen_t2, current_floor, explored,
+                                enemies_on_map, items_on_map, special_rooms,
+                                tiles, chosen_pos2[0], chosen_pos2[1], visible, log,
+                                terminals_on_map, current_theme,
+                                floor_cells=floor_data['floor_cells'])
+                            if consumed2:
+                                for msg in tick_effects(player, "You"):
+                                    log.appendleft(msg)
+                                e_msgs = enemy_turn(enemies_on_map, tiles, px, py, visible, player,
+                                                    smoke_tiles=smoke_tiles, hazards_on_map=hazards_on_map)
+                                for em in e_msgs:
+                                    log.appendleft(em)
+                                if site.name == 'Erebus Station' and current_floor >= 7 and corruption > 0:
+                                    reduction = min(corruption, 30)
+                                    corruption -= reduction
+                                    log.appendleft(f"// Terminal handshake: signal suppressed -{reduction}%")
                     else:
                         log.appendleft("No unread terminals on this floor.")
                 else:
@@ -653,16 +577,14 @@ def run_site(stdscr, site, player):
                                    f"{'%d hazard(s) marked.' % n if n else 'no hazards here.'}")
                 elif item.effect == 'emp':
                     count = 0
-                    for pos, e in enemies_on_map.items():
-                        if pos in visible and e.name in ('Drone', 'Sentry'):
+                    for pos in enemies_on_map.keys() & visible:
+                        e = enemies_on_map[pos]
+                        if e.name in ('Drone', 'Sentry'):
                             apply_effect(e, 'stun', 2)
                             count += 1
                     log.appendleft(f"EMP Charge: {count} unit(s) disabled.")
                 elif item.effect == 'scanner':
-                    for sy2 in range(MAP_H):
-                        for sx2 in range(MAP_W):
-                            if tiles[sy2][sx2] == FLOOR:
-                                explored.add((sx2, sy2))
+                    explored.update(floor_data['floor_cells'])
                     log.appendleft("Scanner Chip activated — full floor mapped.")
                 elif item.effect == 'smoke':
                     radius = 3
@@ -720,9 +642,8 @@ def run_site(stdscr, site, player):
                     if target_pos is not None:
                         tx, ty  = target_pos
                         hit_pos = None
-                        for lx, ly in _bresenham(px, py, tx, ty):
-                            if (lx, ly) == (px, py):
-                                continue
+                        for ox, oy in _ray(tx - px, ty - py):
+                            lx, ly = px + ox, py + oy
                             if tiles[ly][lx] == WALL:
                                 break
                             if (lx, ly) in enemies_on_map:
@@ -882,14 +803,14 @@ def run_site(stdscr, site, player):
                                                                'gloves', 'boots', 'tool')]
                                         avail = list(sroom['tiles'] - {(px, py)})
                                         for pos in random.sample(avail, min(3, len(avail))):
-                                            items_on_map[pos] = copy.copy(random.choice(gear))
+                                            items_on_map[pos] = random.choice(gear).clone()
                                         log.appendleft("ARMORY — Equipment available.")
                                     elif rtype == 'medbay':
                                         player.hp = player.max_hp
                                         heals = [it for it in ITEM_TEMPLATES if it.consumable]
                                         avail = list(sroom['tiles'] - {(px, py)})
                                         for pos in random.sample(avail, min(2, len(avail))):
-                                            items_on_map[pos] = copy.copy(random.choice(heals))
+                                            items_on_map[pos] = random.choice(heals).clone()
                                         log.appendleft("MED BAY — HP restored. Supplies found.")
                                     elif rtype == 'terminal_hub':
                                         hub_lore = (random.sample(LORE_POOL, 1) +
@@ -904,11 +825,9 @@ def run_site(stdscr, site, player):
                                         if ui.show_vault_prompt(stdscr, cost, player.credits):
                                             if player.credits >= cost:
                                                 player.credits -= cost
-                                                rare = [it for it in ITEM_TEMPLATES
-                                                        if it.atk >= 3 or it.dfn >= 3]
                                                 avail = list(sroom['tiles'] - {(px, py)})
                                                 for pos in random.sample(avail, min(4, len(avail))):
-                                                    items_on_map[pos] = copy.copy(random.choice(rare))
+                                                    items_on_map[pos] = random.choice(RARE_ITEMS).clone()
                                                 log.appendleft("VAULT OPENED. Rare gear inside.")
                                             else:
                                                 sroom['triggered'] = False
@@ -982,10 +901,7 @@ def run_site(stdscr, site, player):
                     log.appendleft(em)
 
                 # Tick smoke clouds after each enemy turn
-                for spos in list(smoke_tiles.keys()):
-                    smoke_tiles[spos] -= 1
-                    if smoke_tiles[spos] <= 0:
-                        del smoke_tiles[spos]
+                smoke_tiles = {spos: t - 1 for spos, t in smoke_tiles.items() if t > 1}
 
         visible   = compute_fov(tiles, px, py, player.fov_radius)
         explored |= visible
@@ -1040,10 +956,17 @@ def run_overland(stdscr, site, player):
         curses.KEY_RIGHT: ( 1,  0),
     }
 
+    ui.invalidate_overland()   # whatever was on screen before is not the overland
+    last_pos = None
+    dirty    = True
     while True:
-        visible = compute_fov(overland['tiles'], ox, oy, FOV_RADIUS * 2)
-        overland['explored'] |= visible
-        ui.draw_overland(stdscr, overland, (ox, oy), site.name, player, log, visible)
+        if dirty:   # only redraw after something the screen shows has changed
+            if (ox, oy) != last_pos:   # sight only changes when the player moves
+                visible  = compute_fov(overland['tiles'], ox, oy, FOV_RADIUS * 2)
+                last_pos = (ox, oy)
+                overland['explored'] |= visible
+            ui.draw_overland(stdscr, overland, (ox, oy), site.name, player, log, visible)
+            dirty = False
 
         key = stdscr.getch()
 
@@ -1056,16 +979,22 @@ def run_overland(stdscr, site, player):
             if (0 <= nx < MAP_W and 0 <= ny < MAP_H
                     and overland['tiles'][ny][nx] not in OV_IMPASSABLE):
                 ox, oy = nx, ny
+                dirty  = True
                 stepped_poi = next((p for p in overland['pois'] if p['pos'] == (ox, oy)), None)
                 if stepped_poi:
                     log.appendleft(f"{stepped_poi['label']} — press > to enter.")
                 elif (ox, oy) == landing:
                     log.appendleft("Landing pad. Press B to return to ship.")
 
+        elif key == curses.KEY_RESIZE:
+            dirty = True
+
         elif key == ord('>'):
+            dirty = True
             if at_poi:
                 poi_site = site if at_poi['is_main'] else at_poi['site']
                 result = run_site(stdscr, poi_site, player)
+                ui.invalidate_overland()
                 ox, oy = at_poi['pos']
                 if result in ('dead', 'restart'):
                     return result
@@ -1074,6 +1003,7 @@ def run_overland(stdscr, site, player):
                 log.appendleft("Nothing to enter here.")
 
         elif key in (ord('b'), ord('B')):
+            dirty = True
             if (ox, oy) == landing:
                 return 'back_to_ship'
             else:
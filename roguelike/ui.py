@@ -1,17 +1,71 @@
 """All curses rendering and UI functions."""
 
 import collections
-import copy
 import curses
+import functools
+import heapq
 import random
 
 from .constants import *
-from .entities import Player, Terminal
-from .world import apply_effect, compute_fov, make_floor, get_theme, _bresenham
-from .data import ITEM_TEMPLATES, LORE_POOL, SHOP_STOCK, WIN_TERMINAL, RACES, CLASSES
+from .entities import Player, Terminal, Enemy
+from .world import (apply_effect, compute_fov, make_floor, get_theme, find_floor_cells,
+                    reveal_rect, _ray, ENEMY_TEMPLATES)
+from .data import LORE_POOL, SHOP_STOCK, WIN_TERMINAL, RACES, CLASSES, RARE_ITEMS
 from .lore_gen import generate_terminal
 
 
+@functools.lru_cache(maxsize=64)
+def _hrule(ch, n):
+    """ch repeated n times; shared between modals instead of rebuilt per frame."""
+    return ch * n
+
+
+@functools.lru_cache(maxsize=64)
+def _blank_row(n):
+    return ' ' * n
+
+
+# Pre-built "│ … │" side-wall rows for each modal width, so a body row is one
+# addstr instead of two addch calls plus a blanking addstr.
+_VROW = {w: '\u2502' + _blank_row(w - 2) + '\u2502' for w in (34, 36, 56, 58, 62)}
+
+# SKILL_ORDER position of each skill key, so the skills screens avoid list.index().
+_SKILL_POS = {sk: i for i, sk in enumerate(SKILL_ORDER)}
+
+
+def _drain_repeats(stdscr, keys):
+    """Count further presses of any of *keys* already waiting in the input queue.
+    Reads without blocking; the first non-matching key is pushed back so the
+    next getch() still sees it. Lets a held key cost one redraw, not one per repeat."""
+    n = 0
+    stdscr.nodelay(True)
+    try:
+        while True:
+            k = stdscr.getch()
+            if k == -1:
+                break
+            if k not in keys:
+                curses.ungetch(k)
+                break
+            n += 1
+    finally:
+        stdscr.nodelay(False)
+    return n
+
+
+def _reservoir_sample(iterable, k):
+    """Pick up to k items uniformly from an iterable in one pass without building a list."""
+    picks = []
+    for i, item in enumerate(iterable):
+        if i < k:
+            picks.append(item)
+        else:
+            j = random.randint(0, i)
+            if j < k:
+                picks[j] = item
+    return picks
+
+
 def setup_colors():
     curses.start_color()
     curses.use_default_colors()
@@ -38,6 +92,60 @@ def setup_colors():
     curses.init_pair(COLOR_OV_OPEN,      curses.COLOR_GREEN,   -1)
     curses.init_pair(COLOR_OV_FOREST,    curses.COLOR_GREEN,   -1)
     curses.init_pair(COLOR_OV_WATER,     curses.COLOR_BLUE,    -1)
+    _init_attrs()
+
+
+# Common text attributes, filled in by _init_attrs() once the colour pairs exist.
+PANEL_ATTR  = 0
+PANEL_BOLD  = 0
+PANEL_DIM   = 0
+TERM_ATTR   = 0
+TERM_BOLD   = 0
+PLAYER_BOLD = 0
+DARK_DIM    = 0
+ENEMY_BOLD  = 0
+HP_LOW_BOLD = 0
+ITEM_BOLD   = 0
+TARGET_BOLD = 0
+_OV_TILE_ATTRS = {}
+_OV_POI_ATTRS  = {}
+
+
+def _init_attrs():
+    """Cache the colour-pair attributes the modals use on every frame."""
+    global PANEL_ATTR, PANEL_BOLD, PANEL_DIM, TERM_ATTR, TERM_BOLD, PLAYER_BOLD
+    global DARK_DIM, ENEMY_BOLD, HP_LOW_BOLD, ITEM_BOLD, TARGET_BOLD
+    PANEL_ATTR  = curses.color_pair(COLOR_PANEL)
+    PANEL_BOLD  = PANEL_ATTR | curses.A_BOLD
+    PANEL_DIM   = PANEL_ATTR | curses.A_DIM
+    TERM_ATTR   = curses.color_pair(COLOR_TERMINAL)
+    TERM_BOLD   = TERM_ATTR | curses.A_BOLD
+    PLAYER_BOLD = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
+    DARK_DIM    = curses.color_pair(COLOR_DARK)   | curses.A_DIM
+    ENEMY_BOLD  = curses.color_pair(COLOR_ENEMY)  | curses.A_BOLD
+    HP_LOW_BOLD = curses.color_pair(COLOR_HP_LOW) | curses.A_BOLD
+    ITEM_BOLD   = curses.color_pair(COLOR_ITEM)   | curses.A_BOLD
+    TARGET_BOLD = curses.color_pair(COLOR_TARGET) | curses.A_BOLD
+
+    # Overland terrain tile → attribute, and POI type → attribute
+    _OV_TILE_ATTRS.clear()
+    _OV_TILE_ATTRS.update({
+        '.':        curses.color_pair(COLOR_WALL)      | curses.A_DIM,
+        OV_OPEN:    curses.color_pair(COLOR_OV_OPEN),
+        OV_BLOCK:   curses.color_pair(COLOR_WALL)      | curses.A_BOLD,
+        OV_TREE:    curses.color_pair(COLOR_OV_FOREST) | curses.A_DIM,
+        OV_SHRUB:   curses.color_pair(COLOR_OV_FOREST) | curses.A_DIM,
+        OV_CRYSTAL: curses.color_pair(COLOR_PANEL)     | curses.A_DIM,
+        OV_SCRAP:   curses.color_pair(COLOR_WALL)      | curses.A_DIM,
+        OV_WATER:   curses.color_pair(COLOR_OV_WATER),
+        OV_LANDING: curses.color_pair(COLOR_TERMINAL)  | curses.A_BOLD,
+    })
+    _OV_POI_ATTRS.clear()
+    _OV_POI_ATTRS.update({
+        'dungeon':  curses.color_pair(COLOR_STAIR)    | curses.A_BOLD,
+        'town':     ITEM_BOLD,
+        'facility': TERM_BOLD,
+    })
 
 
 def draw_panel(stdscr, player, col, rows, current_floor, max_floor=MAX_FLOOR, floor_name=None, corruption=0):
@@ -144,6 +252,7 @@ def draw(stdscr, tiles, px, py, player, visible, explored, items_on_map,
         my = sy + cam_y
         if my >= MAP_H:
             break
+        row = tiles[my]
         for sx in range(map_w):
             mx = sx + cam_x
             if mx >= MAP_W:
@@ -156,7 +265,7 @@ def draw(stdscr, tiles, px, py, player, visible, explored, items_on_map,
                 ch   = PLAYER
                 attr = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
             elif (mx, my) in visible:
-                if tiles[my][mx] == WALL:
+                if row[mx] == WALL:
                     ch   = WALL
                     attr = wall_attr
                 elif (mx, my) == stair_down:
@@ -219,13 +328,13 @@ def draw(stdscr, tiles, px, py, player, visible, explored, items_on_map,
                         ch   = h['char']
                         attr = curses.color_pair(COLOR_HAZARD) | curses.A_DIM
                     else:
-                        ch   = tiles[my][mx]
+                        ch   = row[mx]
                         attr = curses.color_pair(COLOR_DARK) | curses.A_DIM
-                elif tiles[my][mx] == WALL:
+                elif row[mx] == WALL:
                     ch   = WALL
                     attr = wall_attr | curses.A_DIM
                 else:
-                    ch   = tiles[my][mx]
+                    ch   = row[mx]
                     attr = curses.color_pair(COLOR_DARK) | curses.A_DIM
 
             # Targeting overlay — drawn on top of everything else
@@ -233,7 +342,7 @@ def draw(stdscr, tiles, px, py, player, visible, explored, items_on_map,
                 if (mx, my) == target_pos:
                     ch   = 'X'
                     attr = curses.color_pair(COLOR_TARGET) | curses.A_BOLD
-                elif (mx, my) in target_line and tiles[my][mx] == FLOOR:
+                elif (mx, my) in target_line and row[mx] == FLOOR:
                     ch   = '~'
                     attr = curses.color_pair(COLOR_STAIR)
 
@@ -351,6 +460,7 @@ def show_minimap(stdscr, tiles, px, py, player, visible, explored, items_on_map,
             my = sy + cam_y
             if my >= MAP_H:
                 break
+            row = tiles[my]
             for sx in range(map_cols):
                 mx = sx + cam_x
                 if mx >= MAP_W:
@@ -392,7 +502,7 @@ def show_minimap(stdscr, tiles, px, py, player, visible, explored, items_on_map,
                         ch   = h['char']
                         attr = curses.color_pair(COLOR_HAZARD) | (curses.A_BOLD if in_sight else curses.A_DIM)
                     else:
-                        ch   = tiles[my][mx]
+                        ch   = row[mx]
                         attr = curses.color_pair(COLOR_DARK) | curses.A_DIM
                 elif smoke_tiles and (mx, my) in smoke_tiles:
                     ch   = '%'
@@ -401,7 +511,7 @@ def show_minimap(stdscr, tiles, px, py, player, visible, explored, items_on_map,
                     glyph_ch, glyph_cp = room_label_map[(mx, my)]
                     ch   = glyph_ch
                     attr = curses.color_pair(glyph_cp) | curses.A_BOLD
-                elif tiles[my][mx] == WALL:
+                elif row[mx] == WALL:
                     ch   = '#'
                     attr = wall_attr
                 else:
@@ -512,8 +622,8 @@ def show_equipment_screen(stdscr, player, px=0, py=0, items_on_map=None):
         box_h      = content_h + 3   # top border + content + footer + bottom border
         box_y      = max(0, (term_h - box_h) // 2)
         box_x      = max(0, (term_w - BOX_W) // 2)
-        panel_attr = curses.color_pair(COLOR_PANEL)
-        bold_attr  = panel_attr | curses.A_BOLD
+        panel_attr = PANEL_ATTR
+        bold_attr  = PANEL_BOLD
 
         # -- Top border with embedded title --
         title_str = f" EQUIPMENT  ({len(player.inventory)}/{MAX_INVENTORY}) "
@@ -539,9 +649,7 @@ def show_equipment_screen(stdscr, player, px=0, py=0, items_on_map=None):
                         all(c.isupper() or not c.isalpha() for c in text.strip()))
 
             try:
-                stdscr.addch(row, box_x,           curses.ACS_VLINE, panel_attr)
-                stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-                stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+                stdscr.addstr(row, box_x, _VROW[BOX_W], panel_attr)
             except curses.error:
                 pass
 
@@ -564,11 +672,9 @@ def show_equipment_screen(stdscr, player, px=0, py=0, items_on_map=None):
         footer_row = box_y + 1 + content_h
         FOOTER     = "  Enter:equip/use  D:drop  Esc/I:close"
         try:
-            stdscr.addch(footer_row, box_x,           curses.ACS_VLINE, panel_attr)
-            stdscr.addch(footer_row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-            stdscr.addstr(footer_row, box_x + 1, ' ' * (BOX_W - 2))
+            stdscr.addstr(footer_row, box_x, _VROW[BOX_W], panel_attr)
             stdscr.addstr(footer_row, box_x + 1, FOOTER[:BOX_W - 2],
-                          panel_attr | curses.A_DIM)
+                          PANEL_DIM)
         except curses.error:
             pass
 
@@ -639,8 +745,8 @@ def show_shop_screen(stdscr, player, stock):
 
     while True:
         term_h, term_w = stdscr.getmaxyx()
-        panel_attr = curses.color_pair(COLOR_PANEL)
-        bold_attr  = panel_attr | curses.A_BOLD
+        panel_attr = PANEL_ATTR
+        bold_attr  = PANEL_BOLD
 
         rows_content = []   # (text, stock_idx or None)
         rows_content.append(("  AVAILABLE ITEMS", None))
@@ -691,9 +797,7 @@ def show_shop_screen(stdscr, player, stock):
             flat_idx = scroll_off + ri
             is_sel   = bool(selectable_rows and selectable_rows[cur_sel] == flat_idx)
             try:
-                stdscr.addch(row, box_x,             curses.ACS_VLINE, panel_attr)
-                stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-                stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+                stdscr.addstr(row, box_x, _VROW[BOX_W], panel_attr)
             except curses.error:
                 pass
             if is_sel:
@@ -710,10 +814,8 @@ def show_shop_screen(stdscr, player, stock):
         footer_row = box_y + 1 + content_h
         FOOTER     = "  Enter:buy   W/S:scroll   Esc:close"
         try:
-            stdscr.addch(footer_row, box_x,             curses.ACS_VLINE, panel_attr)
-            stdscr.addch(footer_row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-            stdscr.addstr(footer_row, box_x + 1, ' ' * (BOX_W - 2))
-            stdscr.addstr(footer_row, box_x + 1, FOOTER[:BOX_W - 2], panel_attr | curses.A_DIM)
+            stdscr.addstr(footer_row, box_x, _VROW[BOX_W], panel_attr)
+            stdscr.addstr(footer_row, box_x + 1, FOOTER[:BOX_W - 2], PANEL_DIM)
         except curses.error:
             pass
 
@@ -751,7 +853,7 @@ def show_shop_screen(stdscr, player, stock):
                     if len(player.inventory) >= MAX_INVENTORY:
                         return "Inventory full."
                     player.credits -= price
-                    player.inventory.append(copy.copy(item))
+                    player.inventory.append(item.clone())
                     stock.pop(sidx)
                     return f"Bought {item.name} for {price} cr."
 
@@ -760,8 +862,8 @@ def show_vault_prompt(stdscr, cost, player_credits):
     """Small centered modal asking to pay credits to unlock vault.
     Returns True (pay) or False (cancel)."""
     BOX_W      = 36
-    panel_attr = curses.color_pair(COLOR_PANEL)
-    bold_attr  = panel_attr | curses.A_BOLD
+    panel_attr = PANEL_ATTR
+    bold_attr  = PANEL_BOLD
 
     content_lines = [
         ("  VAULT — LOCKED",                               bold_attr),
@@ -787,9 +889,7 @@ def show_vault_prompt(stdscr, cost, player_credits):
         for ri, (text, attr) in enumerate(content_lines):
             row = box_y + 1 + ri
             try:
-                stdscr.addch(row, box_x,             curses.ACS_VLINE, panel_attr)
-                stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-                stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+                stdscr.addstr(row, box_x, _VROW[BOX_W], panel_attr)
                 if text:
                     stdscr.addstr(row, box_x + 1, text[:BOX_W - 2], attr)
             except curses.error:
@@ -817,8 +917,8 @@ def show_terminal(stdscr, terminal):
     terminal.read = True
     BOX_W      = 62
     inner_w    = BOX_W - 4
-    panel_attr = curses.color_pair(COLOR_TERMINAL)
-    head_attr  = panel_attr | curses.A_BOLD
+    panel_attr = TERM_ATTR
+    head_attr  = TERM_BOLD
 
     # Word-wrap each line of content to inner_w
     wrapped = []
@@ -860,9 +960,7 @@ def show_terminal(stdscr, terminal):
     for ri, text in enumerate(rows_content):
         row = box_y + 1 + ri
         try:
-            stdscr.addch(row, box_x,           curses.ACS_VLINE, panel_attr)
-            stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
-            stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+            stdscr.addstr(row, box_x, _VROW[BOX_W], panel_attr)
         except curses.error:
             pass
         if text is None:
@@ -920,9 +1018,8 @@ def show_targeting(stdscr, tiles, px, py, player, visible, explored,
 
         # Trajectory from player to target — stop tracing at first wall
         line_tiles = set()
-        for lx, ly in _bresenham(px, py, tx, ty):
-            if (lx, ly) == (px, py):
-                continue
+        for ox, oy in _ray(tx - px, ty - py):
+            lx, ly = px + ox, py + oy
             line_tiles.add((lx, ly))
             if tiles[ly][lx] == WALL:
                 break
@@ -937,16 +1034,17 @@ def show_targeting(stdscr, tiles, px, py, player, visible, explored,
         if key in (27, ord('f'), ord('F')):      # Esc or F — cancel
             return None, None
         if key == 9:                              # Tab — next target
-            cur = (cur + 1) % len(visible_enemies)
+            steps = 1 + _drain_repeats(stdscr, (9,))
+            cur = (cur + steps) % len(visible_enemies)
         if key in (curses.KEY_ENTER, 10, 13):    # Enter — fire
             return target_pos, target_enemy
 
 
 def show_character_creation(stdscr):
     """Multi-step character creation wizard. Returns a fully configured Player."""
-    panel_attr  = curses.color_pair(COLOR_PANEL)
-    header_attr = panel_attr | curses.A_BOLD
-    sel_attr    = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
+    panel_attr  = PANEL_ATTR
+    header_attr = PANEL_BOLD
+    sel_attr    = PLAYER_BOLD
 
     race_names  = list(RACES.keys())
     class_names = list(CLASSES.keys())
@@ -1137,7 +1235,7 @@ def show_character_creation(stdscr):
                 sdata = SKILLS[sk]
                 cat   = sdata['cat']
                 if cat != cur_cat:
-                    safe_addstr(row, 2, cat.upper(), panel_attr | curses.A_BOLD)
+                    safe_addstr(row, 2, cat.upper(), header_attr)
                     row += 1
                     cur_cat = cat
                 bg_lv    = bg_skills.get(sk, 0)
@@ -1237,9 +1335,9 @@ def show_skill_levelup_modal(stdscr, player, points=2):
     """Modal for spending skill points after levelling up.
     points: how many the player may spend now; any unspent are banked to player.skill_points."""
     BOX_W      = 56
-    panel_attr = curses.color_pair(COLOR_PANEL)
-    hi_attr    = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
-    head_attr  = panel_attr | curses.A_BOLD
+    panel_attr = PANEL_ATTR
+    hi_attr    = PLAYER_BOLD
+    head_attr  = PANEL_BOLD
 
     remaining  = points
     allocated  = {k: 0 for k in SKILL_ORDER}   # points spent THIS modal (removable)
@@ -1262,8 +1360,7 @@ def show_skill_levelup_modal(stdscr, player, points=2):
             pass
         for ry in range(1, BOX_H - 1):
             try:
-                stdscr.addch(box_y + ry, box_x, curses.ACS_VLINE, panel_attr)
-                stdscr.addch(box_y + ry, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
+                stdscr.addstr(box_y + ry, box_x, _VROW[BOX_W], panel_attr)
             except curses.error:
                 pass
         try:
@@ -1307,9 +1404,11 @@ def show_skill_levelup_modal(stdscr, player, points=2):
         key = stdscr.getch()
 
         if key in (ord('w'), ord('W'), curses.KEY_UP):
-            cursor = (cursor - 1) % len(SKILL_ORDER)
+            steps  = 1 + _drain_repeats(stdscr, (ord('w'), ord('W'), curses.KEY_UP))
+            cursor = (cursor - steps) % len(SKILL_ORDER)
         elif key in (ord('s'), ord('S'), curses.KEY_DOWN):
-            cursor = (cursor + 1) % len(SKILL_ORDER)
+            steps  = 1 + _drain_repeats(stdscr, (ord('s'), ord('S'), curses.KEY_DOWN))
+            cursor = (cursor + steps) % len(SKILL_ORDER)
         elif key in (ord('d'), ord('D'), curses.KEY_RIGHT):
             sk     = SKILL_ORDER[cursor]
             cur_lv = player.skills.get(sk, 0) + allocated.get(sk, 0)
@@ -1333,9 +1432,9 @@ def show_skill_levelup_modal(stdscr, player, points=2):
 def show_skills_screen(stdscr, player):
     """Read-only skills overview; allows spending banked skill_points if any."""
     BOX_W      = 58
-    panel_attr = curses.color_pair(COLOR_PANEL)
-    hi_attr    = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
-    head_attr  = panel_attr | curses.A_BOLD
+    panel_attr = PANEL_ATTR
+    hi_attr    = PLAYER_BOLD
+    head_attr  = PANEL_BOLD
 
     cursor  = 0
     can_spend = player.skill_points > 0
@@ -1356,7 +1455,7 @@ def show_skills_screen(stdscr, player):
             bar  = '\u2588' * lv + '\u2591' * (SKILL_MAX - lv)
             eff  = sdata['effect'] if lv > 0 else '—'
             line = f"  {sdata['name']:<14} {bar}  {lv}/{SKILL_MAX}   {eff}"
-            attr = hi_attr if (can_spend and SKILL_ORDER.index(sk) == cursor) else panel_attr
+            attr = hi_attr if (can_spend and _SKILL_POS[sk] == cursor) else panel_attr
             rows_content.append((line, attr, sk))
 
         BOX_H  = len(rows_content) + 4   # title + content + blank + footer + borders
@@ -1373,8 +1472,7 @@ def show_skills_screen(stdscr, player):
             pass
         for ry in range(1, BOX_H - 1):
             try:
-                stdscr.addch(box_y + ry, box_x, curses.ACS_VLINE, panel_attr)
-                stdscr.addch(box_y + ry, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
+                stdscr.addstr(box_y + ry, box_x, _VROW[BOX_W], panel_attr)
             except curses.error:
                 pass
         try:
@@ -1397,7 +1495,7 @@ def show_skills_screen(stdscr, player):
         for ri, (text, attr, sk) in enumerate(rows_content):
             row = box_y + 2 + ri
             try:
-                stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+                stdscr.addstr(row, box_x + 1, _blank_row(BOX_W - 2))
                 stdscr.addstr(row, box_x + 1, text[:BOX_W - 2], attr)
             except curses.error:
                 pass
@@ -1409,7 +1507,7 @@ def show_skills_screen(stdscr, player):
             footer = "  K/Esc:close  "
         try:
             stdscr.addstr(box_y + BOX_H - 2, box_x + 1, footer[:BOX_W - 2].center(BOX_W - 2),
-                          panel_attr | curses.A_DIM)
+                          PANEL_DIM)
         except curses.error:
             pass
 
@@ -1419,19 +1517,14 @@ def show_skills_screen(stdscr, player):
         if key in (27, ord('k'), ord('K')):
             break
         if can_spend:
+            # Skill rows are listed in SKILL_ORDER (headers are skipped), so the
+            # cursor is already the position among skill rows — no scan needed.
             if key in (ord('w'), ord('W'), curses.KEY_UP):
-                # Navigate only to skill rows
-                sk_indices = [i for i, (_, _, s) in enumerate(rows_content) if s is not None]
-                cur_sk_pos = next((p for p, idx in enumerate(sk_indices)
-                                   if SKILL_ORDER.index(rows_content[idx][2]) == cursor), 0)
-                if cur_sk_pos > 0:
-                    cursor = SKILL_ORDER.index(rows_content[sk_indices[cur_sk_pos - 1]][2])
+                steps  = 1 + _drain_repeats(stdscr, (ord('w'), ord('W'), curses.KEY_UP))
+                cursor = max(0, cursor - steps)
             elif key in (ord('s'), ord('S'), curses.KEY_DOWN):
-                sk_indices = [i for i, (_, _, s) in enumerate(rows_content) if s is not None]
-                cur_sk_pos = next((p for p, idx in enumerate(sk_indices)
-                                   if SKILL_ORDER.index(rows_content[idx][2]) == cursor), 0)
-                if cur_sk_pos < len(sk_indices) - 1:
-                    cursor = SKILL_ORDER.index(rows_content[sk_indices[cur_sk_pos + 1]][2])
+                steps  = 1 + _drain_repeats(stdscr, (ord('s'), ord('S'), curses.KEY_DOWN))
+                cursor = min(len(SKILL_ORDER) - 1, cursor + steps)
             elif key in (ord('d'), ord('D')):
                 sk    = SKILL_ORDER[cursor]
                 cur_lv = player.skills.get(sk, 0)
@@ -1452,9 +1545,9 @@ def show_levelup_modal(stdscr, player):
     }
     BOX_W      = 34
     BOX_H      = 13
-    panel_attr = curses.color_pair(COLOR_PANEL)
-    hi_attr    = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
-    head_attr  = panel_attr | curses.A_BOLD
+    panel_attr = PANEL_ATTR
+    hi_attr    = PLAYER_BOLD
+    head_attr  = PANEL_BOLD
 
     term_h, term_w = stdscr.getmaxyx()
     box_y = max(0, (term_h - BOX_H) // 2)
@@ -1462,28 +1555,19 @@ def show_levelup_modal(stdscr, player):
 
     cursor = 0
 
+    # Border rows never change while the modal is open; build them once.
+    top  = '\u250c' + _hrule('\u2500', BOX_W - 2) + '\u2510'
+    side = _VROW[BOX_W]
+    bot  = '\u2514' + _hrule('\u2500', BOX_W - 2) + '\u2518'
+
     def _draw():
         # Border
-        try:
-            stdscr.addch(box_y, box_x, curses.ACS_ULCORNER, panel_attr)
-            for bx in range(1, BOX_W - 1):
-                stdscr.addch(box_y, box_x + bx, curses.ACS_HLINE, panel_attr)
-            stdscr.addch(box_y, box_x + BOX_W - 1, curses.ACS_URCORNER, panel_attr)
-        except curses.error:
-            pass
-        for ry in range(1, BOX_H - 1):
+        for ry in range(BOX_H):
+            row_str = top if ry == 0 else bot if ry == BOX_H - 1 else side
             try:
-                stdscr.addch(box_y + ry, box_x, curses.ACS_VLINE, panel_attr)
-                stdscr.addch(box_y + ry, box_x + BOX_W - 1, curses.ACS_VLINE, panel_attr)
+                stdscr.addstr(box_y + ry, box_x, row_str, panel_attr)
             except curses.error:
                 pass
-        try:
-            stdscr.addch(box_y + BOX_H - 1, box_x, curses.ACS_LLCORNER, panel_attr)
-            for bx in range(1, BOX_W - 1):
-                stdscr.addch(box_y + BOX_H - 1, box_x + bx, curses.ACS_HLINE, panel_attr)
-            stdscr.addch(box_y + BOX_H - 1, box_x + BOX_W - 1, curses.ACS_LRCORNER, panel_attr)
-        except curses.error:
-            pass
 
         # Title row
         title = f"  LEVEL UP!  Rank -> {player.level}  "
@@ -1524,13 +1608,29 @@ def show_levelup_modal(stdscr, player):
 
         stdscr.refresh()
 
+    def _mark(i, on):
+        # Cursor moves only touch the '>' cell and the row's attributes
+        row = box_y + 5 + i
+        try:
+            stdscr.addch(row, box_x + 2, '>' if on else ' ')
+            stdscr.chgat(row, box_x + 1, BOX_W - 2, hi_attr if on else panel_attr)
+        except curses.error:
+            pass
+
+    dirty = True
     while True:
-        _draw()
+        if dirty:
+            _draw()
+            dirty = False
         key = stdscr.getch()
-        if key in (ord('w'), ord('W'), curses.KEY_UP):
-            cursor = (cursor - 1) % len(STATS)
-        elif key in (ord('s'), ord('S'), curses.KEY_DOWN):
-            cursor = (cursor + 1) % len(STATS)
+        if key in (ord('w'), ord('W'), curses.KEY_UP, ord('s'), ord('S'), curses.KEY_DOWN):
+            step = -1 if key in (ord('w'), ord('W'), curses.KEY_UP) else 1
+            _mark(cursor, False)
+            cursor = (cursor + step) % len(STATS)
+            _mark(cursor, True)
+            stdscr.refresh()
+        elif key == curses.KEY_RESIZE:
+            dirty = True
         elif key in (ord('\n'), curses.KEY_ENTER, 10, 13):
             stat_name = STATS[cursor]
             new_val = min(STAT_MAX, getattr(player, stat_name) + 1)
@@ -1543,12 +1643,12 @@ def show_levelup_modal(stdscr, player):
 
 def show_run_summary(stdscr, player, site_name, outcome='dead'):
     """Run summary screen shown on death or mid-run restart. Returns True to restart, False to quit."""
-    panel  = curses.color_pair(COLOR_PANEL)
-    bold   = curses.color_pair(COLOR_PANEL)    | curses.A_BOLD
-    dim    = curses.color_pair(COLOR_DARK)     | curses.A_DIM
-    red    = curses.color_pair(COLOR_HP_LOW)   | curses.A_BOLD
-    green  = curses.color_pair(COLOR_ITEM)     | curses.A_BOLD
-    yellow = curses.color_pair(COLOR_TARGET)   | curses.A_BOLD
+    panel  = PANEL_ATTR
+    bold   = PANEL_BOLD
+    dim    = DARK_DIM
+    red    = HP_LOW_BOLD
+    green  = ITEM_BOLD
+    yellow = TARGET_BOLD
 
     total_xp = player.xp + player.XP_PER_LEVEL * (player.level * (player.level - 1) // 2)
 
@@ -1563,48 +1663,51 @@ def show_run_summary(stdscr, player, site_name, outcome='dead'):
 
     BOX_W   = 52
     inner_w = BOX_W - 4
+    div     = _hrule("─", inner_w)
+
+    # (row, text, attr, centre) — nothing here changes while the screen is up
+    lines = [
+        (0,  heading,                              heading_attr, True),
+        (1,  div,                                  dim,          False),
+        (3,  f"{player.name}",                     bold,         True),
+        (4,  f"{player.race}  {player.char_class}", panel,       True),
+        (6,  div,                                  dim,          False),
+        (7,  f"  Site          {site_name}",       panel,        False),
+        (8,  f"  Outcome       {outcome_str}",     panel,        False),
+        (9,  f"  Deepest floor {player.max_floor_reached}", panel, False),
+        (10, div,                                  dim,          False),
+        (12, f"  Enemies killed   {player.enemies_killed}", yellow, False),
+        (13, f"  Items collected  {player.items_found}",    yellow, False),
+        (14, f"  Total XP         {total_xp}",              yellow, False),
+        (15, f"  Final level      {player.level}",          yellow, False),
+        (16, f"  Credits          {player.credits} cr",     yellow, False),
+        (18, div,                                  dim,          False),
+        (20, "[ R ] New run          [ Q ] Quit",  bold,         True),
+    ]
 
+    dirty = True
     while True:
-        term_h, term_w = stdscr.getmaxyx()
-        stdscr.erase()
+        if dirty:
+            term_h, term_w = stdscr.getmaxyx()
+            stdscr.erase()
 
-        # Centre the box
-        bx = max(0, (term_w - BOX_W) // 2)
-        by = max(0, (term_h - 22) // 2)
+            # Centre the box
+            bx = max(0, (term_w - BOX_W) // 2)
+            by = max(0, (term_h - 22) // 2)
 
-        def row(y, text, attr, centre=False):
-            x = bx + 2 + (max(0, inner_w - len(text)) // 2 if centre else 0)
-            try:
-                stdscr.addstr(by + y, x, text[:inner_w], attr)
-            except curses.error:
-                pass
+            for y, text, attr, centre in lines:
+                x = bx + 2 + (max(0, inner_w - len(text)) // 2 if centre else 0)
+                try:
+                    stdscr.addstr(by + y, x, text[:inner_w], attr)
+                except curses.error:
+                    pass
 
-        div = "─" * inner_w
-
-        row(0,  heading,                              heading_attr, centre=True)
-        row(1,  div,                                  dim)
-        row(2,  "",                                   0)
-        row(3,  f"{player.name}",                     bold, centre=True)
-        row(4,  f"{player.race}  {player.char_class}", panel, centre=True)
-        row(5,  "",                                   0)
-        row(6,  div,                                  dim)
-        row(7,  f"  Site          {site_name}",       panel)
-        row(8,  f"  Outcome       {outcome_str}",     panel)
-        row(9,  f"  Deepest floor {player.max_floor_reached}", panel)
-        row(10, div,                                  dim)
-        row(11, "",                                   0)
-        row(12, f"  Enemies killed   {player.enemies_killed}", yellow)
-        row(13, f"  Items collected  {player.items_found}",    yellow)
-        row(14, f"  Total XP         {total_xp}",              yellow)
-        row(15, f"  Final level      {player.level}",          yellow)
-        row(16, f"  Credits          {player.credits} cr",     yellow)
-        row(17, "",                                   0)
-        row(18, div,                                  dim)
-        row(19, "",                                   0)
-        row(20, "[ R ] New run          [ Q ] Quit",  bold, centre=True)
+            stdscr.refresh()
+            dirty = False
 
-        stdscr.refresh()
         key = stdscr.getch()
+        if key == curses.KEY_RESIZE:
+            dirty = True
 
         if key in (ord('r'), ord('R')):
             return True
@@ -1612,11 +1715,191 @@ def show_run_summary(stdscr, player, site_name, outcome='dead'):
             return False
 
 
+def show_remote_picker(stdscr, others, hint, BOX_W=62):
+    """Terminal picker for remote access. others: [(pos, Terminal), ...].
+    Returns the chosen index into others, or None on Esc."""
+    inner_w = BOX_W - 4
+    rtitle  = " REMOTE ACCESS — Select Terminal "
+    rpad    = BOX_W - 2 - len(rtitle)
+    rleft   = rpad // 2
+    ptop    = ('\u250c' + _hrule('\u2500', rleft) + rtitle
+               + _hrule('\u2500', rpad - rleft) + '\u2510')
+    pmid    = '\u251c' + _hrule('\u2500', BOX_W - 2) + '\u2524'
+    pbot    = '\u2514' + _hrule('\u2500', BOX_W - 2) + '\u2518'
+    side    = _VROW[BOX_W]
+
+    rpick = 0
+    dirty = True
+    while True:
+        if dirty:
+            term_h, term_w = stdscr.getmaxyx()
+            pbox_h = 2 + 2 + len(others) + 1
+            pbox_y = max(0, (term_h - pbox_h) // 2)
+            pbox_x = max(0, (term_w - BOX_W) // 2)
+
+            rows = [(ptop, TERM_BOLD), (side, TERM_BOLD), (pmid, TERM_BOLD)]
+            rows += [(side, TERM_BOLD)] * len(others)
+            rows.append((pbot, TERM_BOLD))
+            for ri, (text, attr) in enumerate(rows):
+                try:
+                    stdscr.addstr(pbox_y + ri, pbox_x, text, attr)
+                except curses.error:
+                    pass
+
+            try:
+                stdscr.addstr(pbox_y + 1, pbox_x + 2, hint[:inner_w + 2], PANEL_ATTR)
+            except curses.error:
+                pass
+
+            for oi, (opos, ot) in enumerate(others):
+                prefix = "  >" if oi == rpick else "   "
+                label  = f"{prefix} {ot.title[:inner_w - 1]}"
+                attr   = PLAYER_BOLD if oi == rpick else PANEL_ATTR
+                try:
+                    stdscr.addstr(pbox_y + 3 + oi, pbox_x + 2, label[:inner_w + 2], attr)
+                except curses.error:
+                    pass
+
+            stdscr.refresh()
+            dirty = False
+
+        pk = stdscr.getch()
+
+        if pk == 27:
+            return None
+        if pk in (ord('w'), curses.KEY_UP):
+            rpick = (rpick - 1) % len(others)
+            dirty = True
+        elif pk in (ord('s'), curses.KEY_DOWN):
+            rpick = (rpick + 1) % len(others)
+            dirty = True
+        elif pk == curses.KEY_RESIZE:
+            dirty = True
+        elif pk in (curses.KEY_ENTER, ord('\n'), ord('\r')):
+            return rpick
+
+
+# ── Hacking actions ───────────────────────────────────────────────────────────
+# Each handler takes the interface's context dict and returns True if the hack
+# consumed a turn. Levels 1-5 only run after a successful roll.
+
+def _hack_fail_spawn(ctx):
+    enemies_on_map = ctx['enemies_on_map']
+    px, py         = ctx['px'], ctx['py']
+    scale = 1 + (ctx['current_floor'] - 1) * 0.2
+    picks = _reservoir_sample(
+        (p for p in ctx['floor_cells'] if p not in enemies_on_map and p != (px, py)), 2)
+    for pos in picks:
+        t = random.choices(ENEMY_TEMPLATES, weights=ctx['current_theme']['weights'])[0]
+        enemies_on_map[pos] = Enemy(
+            name=t['name'], char=t['char'],
+            hp=max(1, int(t['hp'] * scale)), atk=max(1, int(t['atk'] * scale)),
+            dfn=int(t['dfn'] * scale), xp_reward=int(t['xp'] * scale),
+            behaviour=t.get('behaviour', 'melee'))
+    ctx['log'].appendleft("HACK FAILED — security alert triggered!")
+
+
+def _hack_tech_xp(player, log):
+    tech_xp = max(0, (player.tech - 5) * 5)
+    if tech_xp:
+        n_lv, lvl_msg = player.gain_xp(tech_xp)
+        log.appendleft(f"Tech interface: +{tech_xp} XP")
+        if lvl_msg:
+            log.appendleft(lvl_msg)
+
+
+def _hack_read_log(ctx):
+    show_terminal(ctx['stdscr'], ctx['terminal'])
+    _hack_tech_xp(ctx['player'], ctx['log'])
+    return False   # no turn consumed
+
+
+def _hack_map_fragment(ctx):
+    reveal_rect(ctx['tiles'], ctx['explored'], ctx['px'], ctx['py'], 15)
+    ctx['log'].appendleft("Map fragment downloaded.")
+    return True
+
+
+def _hack_disable_units(ctx):
+    enemies_on_map = ctx['enemies_on_map']
+    count = 0
+    # keys() & set intersects in C, walking whichever side is smaller
+    for pos in enemies_on_map.keys() & ctx['visible']:
+        e = enemies_on_map[pos]
+        if e.name in ('Sentry', 'Drone'):
+            apply_effect(e, 'stun', 3)
+            count += 1
+    ctx['log'].appendleft(f"Disabled {count} unit(s) in sensor range.")
+    return True
+
+
+def _hack_unlock_vault(ctx):
+    items_on_map = ctx['items_on_map']
+    vault = next((sr2 for sr2 in ctx['special_rooms'].values()
+                  if sr2['type'] == 'vault' and not sr2['triggered']), None)
+    if vault:
+        vault['triggered'] = True
+        avail = list(vault['tiles'])
+        for pos in random.sample(avail, min(4, len(avail))):
+            items_on_map[pos] = random.choice(RARE_ITEMS).clone()
+        ctx['log'].appendleft("Vault override successful. Rare gear inside.")
+    else:
+        ctx['log'].appendleft("No vault found on this floor.")
+    return True
+
+
+def _hack_alert_protocol(ctx):
+    enemies_on_map = ctx['enemies_on_map']
+    px, py         = ctx['px'], ctx['py']
+    scale = 1 + (ctx['current_floor'] - 1) * 0.2
+    # Only the 3 nearest free tiles are needed; no full sort
+    candidates = heapq.nsmallest(
+        3,
+        (p for p in ctx['floor_cells']
+         if p not in enemies_on_map and p != (px, py)),
+        key=lambda pos: abs(pos[0] - px) + abs(pos[1] - py)
+    )
+    for pos in candidates:
+        t = random.choices(ENEMY_TEMPLATES, weights=ctx['current_theme']['weights'])[0]
+        enemies_on_map[pos] = Enemy(
+            name=t['name'], char=t['char'],
+            hp=max(1, int(t['hp'] * scale)), atk=max(1, int(t['atk'] * scale)),
+            dfn=int(t['dfn'] * scale), xp_reward=int(t['xp'] * scale),
+            behaviour=t.get('behaviour', 'melee'))
+    ctx['items_on_map'][(px, py)] = random.choice(RARE_ITEMS).clone()
+    ctx['log'].appendleft("ALERT PROTOCOL — reinforcements converging. Rare cache unlocked.")
+    return True
+
+
+def _hack_remote_access(ctx):
+    stdscr, log = ctx['stdscr'], ctx['log']
+    px, py      = ctx['px'], ctx['py']
+    others = [(pos, t2) for pos, t2 in ctx['terminals_on_map'].items()
+              if not t2.read and pos != (px, py)]
+    if not others:
+        log.appendleft("No unread terminals on this floor.")
+        return False
+    idx = show_remote_picker(stdscr, others, "W/S: select   Enter: read   Esc: cancel")
+    if idx is None:
+        return False
+    show_terminal(stdscr, others[idx][1])
+    _hack_tech_xp(ctx['player'], log)
+    log.appendleft("Remote access successful.")
+    return True
+
+
+_HACK_HANDLERS = (_hack_read_log, _hack_map_fragment, _hack_disable_units,
+                  _hack_unlock_vault, _hack_alert_protocol, _hack_remote_access)
+
+
 def show_hacking_interface(stdscr, player, terminal, current_floor, explored,
                            enemies_on_map, items_on_map, special_rooms,
                            tiles, px, py, visible, log, terminals_on_map,
-                           current_theme):
-    """Hacking terminal interface. Returns True if a turn was consumed."""
+                           current_theme, floor_cells=None):
+    """Hacking terminal interface. Returns True if a turn was consumed.
+    floor_cells: the floor's precomputed FLOOR positions; derived from tiles if omitted."""
+    if floor_cells is None:
+        floor_cells = find_floor_cells(tiles)
     hack_lv = player.skills.get('hacking', 0)
     BOX_W   = 62
     inner_w = BOX_W - 4
@@ -1630,51 +1913,46 @@ def show_hacking_interface(stdscr, player, terminal, current_floor, explored,
         (5, "Remote access",    "Hacking 5"),
     ]
 
+    # Outer box border rows, built once per terminal session
+    title_str = " TERMINAL ACCESS "
+    pad       = BOX_W - 2 - len(title_str)
+    left      = pad // 2
+    box_top   = ('\u250c' + _hrule('\u2500', left) + title_str
+                 + _hrule('\u2500', pad - left) + '\u2510')
+    box_mid   = '\u251c' + _hrule('\u2500', BOX_W - 2) + '\u2524'
+    box_bot   = '\u2514' + _hrule('\u2500', BOX_W - 2) + '\u2518'
+
     # Success rate for levels 1-5
     def _success_rate():
         return max(15, min(90, 60 + (player.tech - 5) * 8 - current_floor * 3))
 
     def _draw_box(sel):
+        """Full redraw; returns the box origin (box_y, box_x)."""
         term_h, term_w = stdscr.getmaxyx()
         box_h = 2 + 3 + len(ACTIONS) + 2   # borders + header rows + actions + footer row + dividers
         box_y = max(0, (term_h - box_h) // 2)
         box_x = max(0, (term_w - BOX_W) // 2)
 
-        term_attr  = curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD
-        panel_attr = curses.color_pair(COLOR_PANEL)
-        dark_attr  = curses.color_pair(COLOR_DARK) | curses.A_DIM
-        sel_attr   = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
+        term_attr  = TERM_BOLD
+        panel_attr = PANEL_ATTR
+        dark_attr  = DARK_DIM
+        sel_attr   = PLAYER_BOLD
 
         def hline(row):
             try:
-                stdscr.addch(row, box_x, curses.ACS_LTEE, term_attr)
-                for bx in range(1, BOX_W - 1):
-                    stdscr.addch(row, box_x + bx, curses.ACS_HLINE, term_attr)
-                stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_RTEE, term_attr)
+                stdscr.addstr(row, box_x, box_mid, term_attr)
             except curses.error:
                 pass
 
         def border_row(row):
             try:
-                stdscr.addch(row, box_x, curses.ACS_VLINE, term_attr)
-                stdscr.addch(row, box_x + BOX_W - 1, curses.ACS_VLINE, term_attr)
-                stdscr.addstr(row, box_x + 1, ' ' * (BOX_W - 2))
+                stdscr.addstr(row, box_x, _VROW[BOX_W], term_attr)
             except curses.error:
                 pass
 
         # Top border
         try:
-            title_str = " TERMINAL ACCESS "
-            pad = BOX_W - 2 - len(title_str)
-            left = pad // 2
-            right = pad - left
-            stdscr.addch(box_y, box_x, curses.ACS_ULCORNER, term_attr)
-            for bx in range(1, left + 1):
-                stdscr.addch(box_y, box_x + bx, curses.ACS_HLINE, term_attr)
-            stdscr.addstr(box_y, box_x + left + 1, title_str, term_attr)
-            for bx in range(left + 1 + len(title_str), BOX_W - 1):
-                stdscr.addch(box_y, box_x + bx, curses.ACS_HLINE, term_attr)
-            stdscr.addch(box_y, box_x + BOX_W - 1, curses.ACS_URCORNER, term_attr)
+            stdscr.addstr(box_y, box_x, box_top, term_attr)
         except curses.error:
             pass
 
@@ -1738,234 +2016,61 @@ def show_hacking_interface(stdscr, player, terminal, current_floor, explored,
         # Bottom border
         bot = box_y + 4 + len(ACTIONS) + 2
         try:
-            stdscr.addch(bot, box_x, curses.ACS_LLCORNER, term_attr)
-            for bx in range(1, BOX_W - 1):
-                stdscr.addch(bot, box_x + bx, curses.ACS_HLINE, term_attr)
-            stdscr.addch(bot, box_x + BOX_W - 1, curses.ACS_LRCORNER, term_attr)
+            stdscr.addstr(bot, box_x, box_bot, term_attr)
         except curses.error:
             pass
 
         stdscr.refresh()
+        return box_y, box_x
+
+    def _mark(i, on):
+        # Selection moves only touch the '>' cell and the row's attributes
+        row = box_y + 4 + i
+        try:
+            stdscr.addch(row, box_x + 4, '>' if on else ' ')
+            stdscr.chgat(row, box_x + 2, inner_w, PLAYER_BOLD if on else PANEL_ATTR)
+        except curses.error:
+            pass
 
-    from .world import ENEMY_TEMPLATES
-
-    def _fail_spawn():
-        scale = 1 + (current_floor - 1) * 0.2
-        floors_avail = [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-                        if tiles[y][x] == FLOOR
-                        and (x, y) not in enemies_on_map and (x, y) != (px, py)]
-        if floors_avail:
-            for pos in random.sample(floors_avail, min(2, len(floors_avail))):
-                t = random.choices(ENEMY_TEMPLATES, weights=current_theme['weights'])[0]
-                from .entities import Enemy
-                enemies_on_map[pos] = Enemy(
-                    name=t['name'], char=t['char'],
-                    hp=max(1, int(t['hp'] * scale)), atk=max(1, int(t['atk'] * scale)),
-                    dfn=int(t['dfn'] * scale), xp_reward=int(t['xp'] * scale),
-                    behaviour=t.get('behaviour', 'melee'))
-        log.appendleft("HACK FAILED — security alert triggered!")
-
-    # Find the initially selected row (first unlocked)
-    sel = 0
+    ctx = {
+        'stdscr': stdscr, 'player': player, 'terminal': terminal,
+        'current_floor': current_floor, 'current_theme': current_theme,
+        'tiles': tiles, 'floor_cells': floor_cells, 'px': px, 'py': py,
+        'explored': explored, 'visible': visible, 'log': log,
+        'enemies_on_map': enemies_on_map, 'items_on_map': items_on_map,
+        'special_rooms': special_rooms, 'terminals_on_map': terminals_on_map,
+    }
 
+    # hack_lv is fixed while the interface is open, so the selectable rows are too.
+    # Row 0 (Read log) is always unlocked.
+    unlocked = [i for i, (req_lv, _, _) in enumerate(ACTIONS) if req_lv <= hack_lv]
+    sel_pos  = 0
+    sel      = unlocked[sel_pos]
+
+    dirty = True
     while True:
-        _draw_box(sel)
+        if dirty:
+            box_y, box_x = _draw_box(sel)
+            dirty = False
         key = stdscr.getch()
 
         if key == 27:           # Esc
             return False
-        if key in (ord('w'), curses.KEY_UP):
-            for step in range(1, len(ACTIONS)):
-                nsel = (sel - step) % len(ACTIONS)
-                if ACTIONS[nsel][0] <= hack_lv:
-                    sel = nsel
-                    break
-        elif key in (ord('s'), curses.KEY_DOWN):
-            for step in range(1, len(ACTIONS)):
-                nsel = (sel + step) % len(ACTIONS)
-                if ACTIONS[nsel][0] <= hack_lv:
-                    sel = nsel
-                    break
+        if key == curses.KEY_RESIZE:
+            dirty = True
+        elif key in (ord('w'), curses.KEY_UP, ord('s'), curses.KEY_DOWN) and len(unlocked) > 1:
+            step    = -1 if key in (ord('w'), curses.KEY_UP) else 1
+            _mark(sel, False)
+            sel_pos = (sel_pos + step) % len(unlocked)
+            sel     = unlocked[sel_pos]
+            _mark(sel, True)
+            stdscr.refresh()
         elif key in (curses.KEY_ENTER, ord('\n'), ord('\r')):
-            req_lv = ACTIONS[sel][0]
-            if req_lv > hack_lv:
-                continue   # locked row, ignore
-
-            # -- Level 0: Read log --
-            if req_lv == 0:
-                show_terminal(stdscr, terminal)
-                tech_xp = max(0, (player.tech - 5) * 5)
-                if tech_xp:
-                    n_lv, lvl_msg = player.gain_xp(tech_xp)
-                    log.appendleft(f"Tech interface: +{tech_xp} XP")
-                    if lvl_msg:
-                        log.appendleft(lvl_msg)
-                return False   # no turn consumed
-
-            # -- Levels 1-5: roll success --
-            sr = _success_rate()
-            success = random.randint(1, 100) <= sr
-
-            if not success:
-                _fail_spawn()
+            req_lv = ACTIONS[sel][0]   # sel only ever lands on unlocked rows
+            if req_lv and random.randint(1, 100) > _success_rate():
+                _hack_fail_spawn(ctx)
                 return True   # turn consumed
-
-            # -- Level 1: Map fragment --
-            if req_lv == 1:
-                for dy in range(-15, 16):
-                    for dx in range(-15, 16):
-                        tx2, ty2 = px + dx, py + dy
-                        if 0 <= tx2 < MAP_W and 0 <= ty2 < MAP_H and tiles[ty2][tx2] == FLOOR:
-                            explored.add((tx2, ty2))
-                log.appendleft("Map fragment downloaded.")
-                return True
-
-            # -- Level 2: Disable units --
-            if req_lv == 2:
-                count = 0
-                for pos, e in enemies_on_map.items():
-                    if pos in visible and e.name in ('Sentry', 'Drone'):
-                        apply_effect(e, 'stun', 3)
-                        count += 1
-                log.appendleft(f"Disabled {count} unit(s) in sensor range.")
-                return True
-
-            # -- Level 3: Unlock vault --
-            if req_lv == 3:
-                vault = next((sr2 for sr2 in special_rooms.values()
-                              if sr2['type'] == 'vault' and not sr2['triggered']), None)
-                if vault:
-                    vault['triggered'] = True
-                    rare = [it for it in ITEM_TEMPLATES if it.atk >= 3 or it.dfn >= 3]
-                    if rare:
-                        avail = list(vault['tiles'])
-                        for pos in random.sample(avail, min(4, len(avail))):
-                            items_on_map[pos] = copy.copy(random.choice(rare))
-                    log.appendleft("Vault override successful. Rare gear inside.")
-                else:
-                    log.appendleft("No vault found on this floor.")
-                return True
-
-            # -- Level 4: Alert protocol --
-            if req_lv == 4:
-                scale = 1 + (current_floor - 1) * 0.2
-                candidates = sorted(
-                    [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-                     if tiles[y][x] == FLOOR
-                     and (x, y) not in enemies_on_map and (x, y) != (px, py)],
-                    key=lambda pos: abs(pos[0] - px) + abs(pos[1] - py)
-                )
-                from .world import ENEMY_TEMPLATES as ET
-                from .entities import Enemy as EnemyCls
-                for pos in candidates[:3]:
-                    t = random.choices(ET, weights=current_theme['weights'])[0]
-                    enemies_on_map[pos] = EnemyCls(
-                        name=t['name'], char=t['char'],
-                        hp=max(1, int(t['hp'] * scale)), atk=max(1, int(t['atk'] * scale)),
-                        dfn=int(t['dfn'] * scale), xp_reward=int(t['xp'] * scale),
-                        behaviour=t.get('behaviour', 'melee'))
-                rare = [it for it in ITEM_TEMPLATES if it.atk >= 3 or it.dfn >= 3]
-                if rare:
-                    items_on_map[(px, py)] = copy.copy(random.choice(rare))
-                log.appendleft("ALERT PROTOCOL — reinforcements converging. Rare cache unlocked.")
-                return True
-
-            # -- Level 5: Remote access --
-            if req_lv == 5:
-                others = [(pos, t2) for pos, t2 in terminals_on_map.items()
-                          if not t2.read and pos != (px, py)]
-                if not others:
-                    log.appendleft("No unread terminals on this floor.")
-                    return False
-                # Show remote picker sub-menu
-                rpick = 0
-                while True:
-                    term_h, term_w = stdscr.getmaxyx()
-                    pbox_h = 2 + 2 + len(others) + 1
-                    pbox_y = max(0, (term_h - pbox_h) // 2)
-                    pbox_x = max(0, (term_w - BOX_W) // 2)
-                    term_attr  = curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD
-                    panel_attr = curses.color_pair(COLOR_PANEL)
-                    sel_attr   = curses.color_pair(COLOR_PLAYER) | curses.A_BOLD
-
-                    def _prow(row):
-                        try:
-                            stdscr.addch(row, pbox_x, curses.ACS_VLINE, term_attr)
-                            stdscr.addch(row, pbox_x + BOX_W - 1, curses.ACS_VLINE, term_attr)
-                            stdscr.addstr(row, pbox_x + 1, ' ' * (BOX_W - 2))
-                        except curses.error:
-                            pass
-
-                    try:
-                        rtitle = " REMOTE ACCESS — Select Terminal "
-                        rpad   = BOX_W - 2 - len(rtitle)
-                        rleft  = rpad // 2
-                        stdscr.addch(pbox_y, pbox_x, curses.ACS_ULCORNER, term_attr)
-                        for bx in range(1, rleft + 1):
-                            stdscr.addch(pbox_y, pbox_x + bx, curses.ACS_HLINE, term_attr)
-                        stdscr.addstr(pbox_y, pbox_x + rleft + 1, rtitle, term_attr)
-                        for bx in range(rleft + 1 + len(rtitle), BOX_W - 1):
-                            stdscr.addch(pbox_y, pbox_x + bx, curses.ACS_HLINE, term_attr)
-                        stdscr.addch(pbox_y, pbox_x + BOX_W - 1, curses.ACS_URCORNER, term_attr)
-                    except curses.error:
-                        pass
-
-                    _prow(pbox_y + 1)
-                    try:
-                        stdscr.addstr(pbox_y + 1, pbox_x + 2,
-                                      "W/S: select   Enter: read   Esc: cancel"[:inner_w + 2],
-                                      panel_attr)
-                    except curses.error:
-                        pass
-
-                    try:
-                        stdscr.addch(pbox_y + 2, pbox_x, curses.ACS_LTEE, term_attr)
-                        for bx in range(1, BOX_W - 1):
-                            stdscr.addch(pbox_y + 2, pbox_x + bx, curses.ACS_HLINE, term_attr)
-                        stdscr.addch(pbox_y + 2, pbox_x + BOX_W - 1, curses.ACS_RTEE, term_attr)
-                    except curses.error:
-                        pass
-
-                    for oi, (opos, ot) in enumerate(others):
-                        orow = pbox_y + 3 + oi
-                        _prow(orow)
-                        prefix = "  >" if oi == rpick else "   "
-                        label  = f"{prefix} {ot.title[:inner_w - 1]}"
-                        attr   = sel_attr if oi == rpick else panel_attr
-                        try:
-                            stdscr.addstr(orow, pbox_x + 2, label[:inner_w + 2], attr)
-                        except curses.error:
-                            pass
-
-                    pbot = pbox_y + 3 + len(others)
-                    try:
-                        stdscr.addch(pbot, pbox_x, curses.ACS_LLCORNER, term_attr)
-                        for bx in range(1, BOX_W - 1):
-                            stdscr.addch(pbot, pbox_x + bx, curses.ACS_HLINE, term_attr)
-                        stdscr.addch(pbot, pbox_x + BOX_W - 1, curses.ACS_LRCORNER, term_attr)
-                    except curses.error:
-                        pass
-
-                    stdscr.refresh()
-                    pk = stdscr.getch()
-
-                    if pk == 27:
-                        return False
-                    if pk in (ord('w'), curses.KEY_UP):
-                        rpick = (rpick - 1) % len(others)
-                    elif pk in (ord('s'), curses.KEY_DOWN):
-                        rpick = (rpick + 1) % len(others)
-                    elif pk in (curses.KEY_ENTER, ord('\n'), ord('\r')):
-                        chosen_t = others[rpick][1]
-                        tech_xp  = max(0, (player.tech - 5) * 5)
-                        show_terminal(stdscr, chosen_t)
-                        if tech_xp:
-                            n_lv, lvl_msg = player.gain_xp(tech_xp)
-                            log.appendleft(f"Tech interface: +{tech_xp} XP")
-                            if lvl_msg:
-                                log.appendleft(lvl_msg)
-                        log.appendleft("Remote access successful.")
-                        return True
+            return _HACK_HANDLERS[req_lv](ctx)
 
 
 def show_cascade_modal(stdscr, player):
@@ -1979,20 +2084,20 @@ def show_cascade_modal(stdscr, player):
     bx      = max(0, (term_w - BOX_W) // 2)
     by      = max(0, (term_h - 18) // 2)
 
-    warn  = curses.color_pair(COLOR_ENEMY)    | curses.A_BOLD
-    panel = curses.color_pair(COLOR_PANEL)    | curses.A_BOLD
-    dim   = curses.color_pair(COLOR_DARK)     | curses.A_DIM
-    hades = curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD
+    warn  = ENEMY_BOLD
+    panel = PANEL_BOLD
+    dim   = DARK_DIM
+    hades = TERM_BOLD
 
     def row(y, text, attr):
         try:
-            stdscr.addstr(by + y, bx, f"  {text[:inner_w]:<{inner_w}}  ", attr)
+            stdscr.addstr(by + y, bx, "  " + text[:inner_w].ljust(inner_w) + "  ", attr)
         except curses.error:
             pass
 
-    row(0,  "=" * inner_w,                                       warn)
+    row(0,  _hrule("=", inner_w),                                warn)
     row(1,  "    >>>   RESONANCE CASCADE TRIGGERED   <<<",        warn)
-    row(2,  "=" * inner_w,                                       warn)
+    row(2,  _hrule("=", inner_w),                                warn)
     row(3,  "",                                                   0)
     row(4,  "SIGNAL STRENGTH:    [\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588]  CRITICAL",  warn)
     row(5,  "NEURAL INTEGRITY:   [\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591\u2591]  CRITICAL",  warn)
@@ -2001,7 +2106,7 @@ def show_cascade_modal(stdscr, player):
     for i, msg in enumerate(msgs):
         row(8 + i, f"[HADES-7]  {msg}",                          hades)
     row(8 + len(msgs),  "",                                       0)
-    row(9 + len(msgs),  "-" * inner_w,                            panel)
+    row(9 + len(msgs),  _hrule("-", inner_w),                     panel)
     row(10 + len(msgs), "",                                       0)
     row(11 + len(msgs), "Neural buffer force-purged. Residual interference will persist.", dim)
     clarity = max(5, 65 - player.mind * 4)
@@ -2015,40 +2120,46 @@ def show_cascade_modal(stdscr, player):
 
 def show_win_screen(stdscr, player):
     """Victory screen. Returns True to play again, False to quit."""
-    panel_attr  = curses.color_pair(COLOR_TERMINAL)
-    header_attr = curses.color_pair(COLOR_TARGET) | curses.A_BOLD
+    panel_attr  = TERM_ATTR
+    header_attr = TARGET_BOLD
 
+    dirty = True
     while True:
-        term_h, term_w = stdscr.getmaxyx()
-        stdscr.erase()
-
-        lines = [
-            ("* SIGNAL ANSWERED *",                          header_attr),
-            ("",                                             0),
-            ("You reached the Signal Source.",               panel_attr),
-            ("You answered.",                                panel_attr),
-            ("Whatever was asking — it listened.",           panel_attr),
-            ("The transmission ends.",                       panel_attr),
-            ("",                                             0),
-            (f"Name:   {player.name}",                      panel_attr),
-            (f"Race:   {player.race}",                      panel_attr),
-            (f"Class:  {player.char_class}",                panel_attr),
-            ("",                                             0),
-            (f"Level reached: {player.level}",              panel_attr),
-            ("",                                             0),
-            ("R: new character    Q: quit",                  panel_attr),
-        ]
+        if dirty:
+            term_h, term_w = stdscr.getmaxyx()
+            stdscr.erase()
+
+            lines = [
+                ("* SIGNAL ANSWERED *",                          header_attr),
+                ("",                                             0),
+                ("You reached the Signal Source.",               panel_attr),
+                ("You answered.",                                panel_attr),
+                ("Whatever was asking — it listened.",           panel_attr),
+                ("The transmission ends.",                       panel_attr),
+                ("",                                             0),
+                (f"Name:   {player.name}",                      panel_attr),
+                (f"Race:   {player.race}",                      panel_attr),
+                (f"Class:  {player.char_class}",                panel_attr),
+                ("",                                             0),
+                (f"Level reached: {player.level}",              panel_attr),
+                ("",                                             0),
+                ("R: new character    Q: quit",                  panel_attr),
+            ]
+
+            start_row = max(0, (term_h - len(lines)) // 2)
+            for i, (text, attr) in enumerate(lines):
+                col = max(0, (term_w - len(text)) // 2)
+                try:
+                    stdscr.addstr(start_row + i, col, text, attr)
+                except curses.error:
+                    pass
 
-        start_row = max(0, (term_h - len(lines)) // 2)
-        for i, (text, attr) in enumerate(lines):
-            col = max(0, (term_w - len(text)) // 2)
-            try:
-                stdscr.addstr(start_row + i, col, text, attr)
-            except curses.error:
-                pass
+            stdscr.refresh()
+            dirty = False
 
-        stdscr.refresh()
         key = stdscr.getch()
+        if key == curses.KEY_RESIZE:
+            dirty = True
         if key in (ord('r'), ord('R')):
             return True
         if key in (ord('q'), ord('Q')):
@@ -2058,55 +2169,61 @@ def show_win_screen(stdscr, player):
 def show_ship_screen(stdscr, player, sites, current_site=None):
     """Hub screen showing ship status.
     Returns 'exit' (leave ship at current location), 'nav', 'restart', or 'quit'."""
-    panel_attr  = curses.color_pair(COLOR_PANEL)
-    header_attr = panel_attr | curses.A_BOLD
-    dim_attr    = curses.color_pair(COLOR_DARK) | curses.A_DIM
+    panel_attr  = PANEL_ATTR
+    header_attr = PANEL_BOLD
+    dim_attr    = DARK_DIM
 
+    dirty = True
     while True:
-        term_h, term_w = stdscr.getmaxyx()
-        stdscr.erase()
-
-        lines = [
-            ("THE MERIDIAN",                                          header_attr),
-            (None,                                                    0),
-            (f"  Pilot: {player.name}",                              panel_attr),
-            (f"  {player.race} {player.char_class}  Lvl {player.level}", panel_attr),
-            (None,                                                    0),
-            (f"  HP:    {player.hp} / {player.max_hp}",              panel_attr),
-            (f"  CR:    {player.credits}",                            panel_attr),
-            (f"  Fuel:  {player.fuel}",                               panel_attr),
-            (None,                                                    0),
-            ("  Location:",                                           header_attr),
-        ]
-
-        if current_site:
-            status = " [cleared]" if current_site.cleared else ""
-            lines.append((f"  {current_site.name}{status}", panel_attr))
-            lines.append(("  " + current_site.desc[:40],   panel_attr))
-        else:
-            lines.append(("  In orbit — no destination set.", panel_attr))
-
-        lines += [(None, 0)]
-        if current_site:
-            lines.append(("  [X] Exit Ship",                         panel_attr))
-        lines += [
-            ("  [N] Navigation Computer",                            panel_attr),
-            ("  [R] New run   [Q] Quit",                             panel_attr),
-        ]
+        if dirty:
+            term_h, term_w = stdscr.getmaxyx()
+            stdscr.erase()
+
+            lines = [
+                ("THE MERIDIAN",                                          header_attr),
+                (None,                                                    0),
+                (f"  Pilot: {player.name}",                              panel_attr),
+                (f"  {player.race} {player.char_class}  Lvl {player.level}", panel_attr),
+                (None,                                                    0),
+                (f"  HP:    {player.hp} / {player.max_hp}",              panel_attr),
+                (f"  CR:    {player.credits}",                            panel_attr),
+                (f"  Fuel:  {player.fuel}",                               panel_attr),
+                (None,                                                    0),
+                ("  Location:",                                           header_attr),
+            ]
+
+            if current_site:
+                status = " [cleared]" if current_site.cleared else ""
+                lines.append((f"  {current_site.name}{status}", panel_attr))
+                lines.append(("  " + current_site.desc[:40],   panel_attr))
+            else:
+                lines.append(("  In orbit — no destination set.", panel_attr))
+
+            lines += [(None, 0)]
+            if current_site:
+                lines.append(("  [X] Exit Ship",                         panel_attr))
+            lines += [
+                ("  [N] Navigation Computer",                            panel_attr),
+                ("  [R] New run   [Q] Quit",                             panel_attr),
+            ]
+
+            start_row = max(0, (term_h - len(lines)) // 2)
+            col_off   = max(0, (term_w - 44) // 2)
+            row = start_row
+            for text, attr in lines:
+                if text is not None:
+                    try:
+                        stdscr.addstr(row, col_off, text[:max(1, term_w - col_off - 1)], attr)
+                    except curses.error:
+                        pass
+                row += 1
 
-        start_row = max(0, (term_h - len(lines)) // 2)
-        col_off   = max(0, (term_w - 44) // 2)
-        row = start_row
-        for text, attr in lines:
-            if text is not None:
-                try:
-                    stdscr.addstr(row, col_off, text[:max(1, term_w - col_off - 1)], attr)
-                except curses.error:
-                    pass
-            row += 1
+            stdscr.refresh()
+            dirty = False
 
-        stdscr.refresh()
         key = stdscr.getch()
+        if key == curses.KEY_RESIZE:
+            dirty = True
 
         if key in (ord('x'), ord('X')) and current_site:
             return 'exit'
@@ -2118,10 +2235,57 @@ def show_ship_screen(stdscr, player, sites, current_site=None):
             return 'quit'
 
 
+# Shadow framebuffer for draw_overland: what it painted last frame, so the next
+# frame only touches cells and lines that changed. Anything else that draws over
+# the screen while the overland is up must be followed by invalidate_overland().
+_ov_cells = {}     # (y, x) -> (ch, attr) on the map area
+_ov_lines = {}     # (y, x) -> (text, attr) for panel and log rows
+_ov_size  = None   # (h, w) the buffer was built for
+_ov_text_key = None  # panel/log inputs behind _ov_lines
+
+
+def _addstr_runs(stdscr, changes):
+    """Write {(y, x): (ch, attr)} cells, one addstr per horizontal run of
+    adjacent cells that share an attribute."""
+    run_y = run_x = next_x = run_attr = None
+    run   = []
+    for y, x in sorted(changes):
+        ch, attr = changes[(y, x)]
+        if y == run_y and x == next_x and attr == run_attr:
+            run.append(ch)
+        else:
+            if run:
+                try:
+                    stdscr.addstr(run_y, run_x, ''.join(run), run_attr)
+                except curses.error:
+                    pass
+            run_y, run_x, run_attr, run = y, x, attr, [ch]
+        next_x = x + 1
+    if run:
+        try:
+            stdscr.addstr(run_y, run_x, ''.join(run), run_attr)
+        except curses.error:
+            pass
+
+
+def invalidate_overland():
+    """Forget the overland shadow buffer; the next draw_overland repaints everything."""
+    global _ov_size, _ov_text_key
+    _ov_cells.clear()
+    _ov_lines.clear()
+    _ov_size     = None
+    _ov_text_key = None
+
+
 def draw_overland(stdscr, overland, player_pos, site_name, player, log, visible):
-    """Draw the overland surface map, panel, and log."""
-    stdscr.erase()
+    """Draw the overland surface map, panel, and log.
+    Diffs against the previous frame and only writes cells that changed."""
+    global _ov_size, _ov_text_key
     h, w = stdscr.getmaxyx()
+    if _ov_size != (h, w):
+        invalidate_overland()
+        _ov_size = (h, w)
+        stdscr.erase()
     map_cols = w - PANEL_W
 
     tiles    = overland['tiles']
@@ -2131,61 +2295,76 @@ def draw_overland(stdscr, overland, player_pos, site_name, player, log, visible)
     # Build a position → POI lookup for overlay rendering
     poi_map = {p['pos']: p for p in overland.get('pois', [])}
 
-    # Terrain tile → (char, attr) defaults
-    tile_attrs = {
-        '.':        curses.color_pair(COLOR_WALL)      | curses.A_DIM,
-        OV_OPEN:    curses.color_pair(COLOR_OV_OPEN),
-        OV_BLOCK:   curses.color_pair(COLOR_WALL)      | curses.A_BOLD,
-        OV_TREE:    curses.color_pair(COLOR_OV_FOREST) | curses.A_DIM,
-        OV_SHRUB:   curses.color_pair(COLOR_OV_FOREST) | curses.A_DIM,
-        OV_CRYSTAL: curses.color_pair(COLOR_PANEL)     | curses.A_DIM,
-        OV_SCRAP:   curses.color_pair(COLOR_WALL)      | curses.A_DIM,
-        OV_WATER:   curses.color_pair(COLOR_OV_WATER),
-        OV_LANDING: curses.color_pair(COLOR_TERMINAL)  | curses.A_BOLD,
-    }
+    # Center camera on player, clamped to map bounds, and cull to the viewport
+    view_h = max(0, h - LOG_LINES)
+    cam_x  = max(0, min(ox - map_cols // 2, max(0, MAP_W - map_cols)))
+    cam_y  = max(0, min(oy - view_h  // 2, max(0, MAP_H - view_h)))
+    x1     = min(MAP_W, cam_x + map_cols)
+    y1     = min(MAP_H, cam_y + view_h)
+
+    # Only explored cells can show anything: walk whichever of the viewport
+    # rectangle or the explored set is smaller.
+    if len(explored) > (x1 - cam_x) * (y1 - cam_y):
+        seen = [(tx, ty) for ty in range(cam_y, y1) for tx in range(cam_x, x1)
+                if (tx, ty) in explored]
+    else:
+        seen = [pos for pos in explored
+                if cam_x <= pos[0] < x1 and cam_y <= pos[1] < y1]
+
+    # Build this frame's map cells without touching curses. Lookups are bound
+    # to locals and attributes come from the tables built in _init_attrs().
+    cells     = {}
+    tile_attr = _OV_TILE_ATTRS.get
+    open_attr = _OV_TILE_ATTRS[OV_OPEN]
+    poi_attr  = _OV_POI_ATTRS.get
+    poi_at    = poi_map.get
+    dark_attr = DARK_DIM
+    for pos in seen:
+        tx, ty = pos
+        poi = poi_at(pos)
+        if poi:
+            ch   = poi['char']
+            attr = poi_attr(poi['type'], ITEM_BOLD)
+        else:
+            ch   = tiles[ty][tx]
+            attr = tile_attr(ch, open_attr)
+        if pos not in visible:
+            attr = dark_attr
+        cells[(ty - cam_y, tx - cam_x)] = (ch, attr)
 
-    # POI type → render attribute
-    poi_attrs = {
-        'dungeon':  curses.color_pair(COLOR_STAIR)    | curses.A_BOLD,
-        'town':     curses.color_pair(COLOR_ITEM)     | curses.A_BOLD,
-        'facility': curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD,
-    }
+    # Draw player
+    cells[(oy - cam_y, ox - cam_x)] = (PLAYER, PLAYER_BOLD)
+
+    # Blank map cells drawn last frame but not this one, then write the changes
+    changes = dict.fromkeys(_ov_cells.keys() - cells.keys(), (' ', 0))
+    prev    = _ov_cells.get
+    for cell, val in cells.items():
+        if prev(cell) != val:
+            changes[cell] = val
+    _addstr_runs(stdscr, changes)
+    _ov_cells.clear()
+    _ov_cells.update(cells)
+
+    # Panel and log text only change with these; skip both when they match
+    at_poi   = poi_map.get(player_pos)
+    text_key = (player.hp, player.max_hp, player.credits, player.fuel, site_name,
+                at_poi and (at_poi['label'], at_poi['type']), tuple(log))
+    if text_key != _ov_text_key:
+        _draw_overland_text(stdscr, h, w, site_name, player, log, at_poi)
+        _ov_text_key = text_key
 
-    for ty in range(min(MAP_H, h - LOG_LINES)):
-        for tx in range(min(MAP_W, map_cols)):
-            pos = (tx, ty)
-            if pos not in explored:
-                continue
-            poi = poi_map.get(pos)
-            if poi:
-                ch   = poi['char']
-                attr = poi_attrs.get(poi['type'], curses.color_pair(COLOR_ITEM) | curses.A_BOLD)
-            else:
-                ch   = tiles[ty][tx]
-                attr = tile_attrs.get(ch, curses.color_pair(COLOR_OV_OPEN))
-            if pos not in visible:
-                attr = curses.color_pair(COLOR_DARK) | curses.A_DIM
-            try:
-                stdscr.addch(ty, tx, ch, attr)
-            except curses.error:
-                pass
+    stdscr.refresh()
 
-    # Draw player
-    try:
-        stdscr.addch(oy, ox, PLAYER,
-                     curses.color_pair(COLOR_PLAYER) | curses.A_BOLD)
-    except curses.error:
-        pass
 
-    # Right panel
+def _draw_overland_text(stdscr, h, w, site_name, player, log, at_poi):
+    """Right panel and message log for draw_overland, diffed against _ov_lines."""
+    map_cols  = w - PANEL_W
     panel_col = w - PANEL_W
-    p_attr    = curses.color_pair(COLOR_PANEL)
-    hd_attr   = p_attr | curses.A_BOLD
-    dim_attr  = curses.color_pair(COLOR_DARK) | curses.A_DIM
-    hp_attr   = (curses.color_pair(COLOR_HP_LOW) | curses.A_BOLD
-                 if player.hp <= player.max_hp // 4 else p_attr)
+    p_attr    = PANEL_ATTR
+    hd_attr   = PANEL_BOLD
+    dim_attr  = DARK_DIM
+    hp_attr   = HP_LOW_BOLD if player.hp <= player.max_hp // 4 else p_attr
 
-    at_poi = poi_map.get(player_pos)
     panel_lines = [
         ("SURFACE",                                   hd_attr),
         (None, 0),
@@ -2194,7 +2373,7 @@ def draw_overland(stdscr, overland, player_pos, site_name, player, log, visible)
     ]
     if at_poi:
         panel_lines += [
-            (at_poi['label'][:PANEL_W - 1],          curses.color_pair(COLOR_TERMINAL) | curses.A_BOLD),
+            (at_poi['label'][:PANEL_W - 1],          TERM_BOLD),
             (f"[{at_poi['type']}]",                  dim_attr),
             (None, 0),
         ]
@@ -2206,26 +2385,36 @@ def draw_overland(stdscr, overland, player_pos, site_name, player, log, visible)
         ("WASD: move",                               p_attr),
         (">: enter   B: ship",                       p_attr),
     ]
+    # Lines are padded to their full width so a shorter string overwrites a longer one
+    lines = {}
     for i, (text, attr) in enumerate(panel_lines):
-        if text is None:
-            continue
-        try:
-            stdscr.addstr(i, panel_col + 1, text[:PANEL_W - 2], attr)
-        except curses.error:
-            pass
+        if text is not None:
+            lines[(i, panel_col + 1)] = (text[:PANEL_W - 2].ljust(PANEL_W - 2), attr)
 
     # Log
     log_start = h - LOG_LINES
     log_list  = list(log)
+    log_w     = max(0, map_cols - 1)
     for i in range(LOG_LINES):
         msg = log_list[i] if i < len(log_list) else ''
+        lines[(log_start + i, 0)] = (msg[:log_w].ljust(log_w), p_attr)
+
+    # Blank whatever was drawn last frame but not this one, then write changes
+    for key in _ov_lines.keys() - lines.keys():
         try:
-            stdscr.addstr(log_start + i, 0, msg[:map_cols - 1],
-                          curses.color_pair(COLOR_PANEL))
+            stdscr.addstr(key[0], key[1], ' ' * len(_ov_lines[key][0]))
         except curses.error:
             pass
+    prev = _ov_lines.get
+    for key, val in lines.items():
+        if prev(key) != val:
+            try:
+                stdscr.addstr(key[0], key[1], val[0], val[1])
+            except curses.error:
+                pass
+    _ov_lines.clear()
+    _ov_lines.update(lines)
 
-    stdscr.refresh()
 
 
 def show_nav_computer(stdscr, player, sites):
@@ -2240,62 +2429,71 @@ def show_nav_computer(stdscr, player, sites):
     cur = 0
     msg = ""
 
+    dirty = True
     while True:
-        term_h, term_w = stdscr.getmaxyx()
-        stdscr.erase()
+        if dirty:
+            term_h, term_w = stdscr.getmaxyx()
+            stdscr.erase()
 
-        title    = "NAV COMPUTER — Choose destination"
-        nav_hint = "W/S: navigate   Enter: travel   Esc: back"
-        try:
-            stdscr.addstr(1, max(0, (term_w - len(title)) // 2), title, header_attr)
-            stdscr.addstr(2, max(0, (term_w - len(nav_hint)) // 2), nav_hint, dim_attr)
-        except curses.error:
-            pass
-
-        start_col = max(0, (term_w - 62) // 2)
-        for i, site in enumerate(sites):
-            row        = 4 + i * 2
-            can_afford = player.fuel >= site.fuel_cost
-            if site.cleared:
-                status = "[cleared]"
-            elif not can_afford:
-                need   = site.fuel_cost - player.fuel
-                status = f"[need {need} more fuel]"
-            else:
-                status = "[available]"
-            cost_str = f"cost: {site.fuel_cost}"
-            text = f"[{site.char}] {site.name:<22} {cost_str:<10} {status}"
-            prefix = "> " if i == cur else "  "
-            attr   = sel_attr if i == cur else (dim_attr if not can_afford else panel_attr)
+            title    = "NAV COMPUTER — Choose destination"
+            nav_hint = "W/S: navigate   Enter: travel   Esc: back"
             try:
-                stdscr.addstr(row, start_col, (prefix + text)[:term_w - start_col - 1], attr)
-                if site.desc:
-                    stdscr.addstr(row + 1, start_col + 4,
-                                  site.desc[:term_w - start_col - 5], dim_attr)
+                stdscr.addstr(1, max(0, (term_w - len(title)) // 2), title, header_attr)
+                stdscr.addstr(2, max(0, (term_w - len(nav_hint)) // 2), nav_hint, dim_attr)
             except curses.error:
                 pass
 
-        if msg:
-            msg_row = 4 + len(sites) * 2 + 1
-            try:
-                stdscr.addstr(msg_row, start_col, msg[:term_w - start_col - 1], err_attr)
-            except curses.error:
-                pass
+            start_col = max(0, (term_w - 62) // 2)
+            for i, site in enumerate(sites):
+                row        = 4 + i * 2
+                can_afford = player.fuel >= site.fuel_cost
+                if site.cleared:
+                    status = "[cleared]"
+                elif not can_afford:
+                    need   = site.fuel_cost - player.fuel
+                    status = f"[need {need} more fuel]"
+                else:
+                    status = "[available]"
+                cost_str = f"cost: {site.fuel_cost}"
+                text = f"[{site.char}] {site.name:<22} {cost_str:<10} {status}"
+                prefix = "> " if i == cur else "  "
+                attr   = sel_attr if i == cur else (dim_attr if not can_afford else panel_attr)
+                try:
+                    stdscr.addstr(row, start_col, (prefix + text)[:term_w - start_col - 1], attr)
+                    if site.desc:
+                        stdscr.addstr(row + 1, start_col + 4,
+                                      site.desc[:term_w - start_col - 5], dim_attr)
+                except curses.error:
+                    pass
+
+            if msg:
+                msg_row = 4 + len(sites) * 2 + 1
+                try:
+                    stdscr.addstr(msg_row, start_col, msg[:term_w - start_col - 1], err_attr)
+                except curses.error:
+                    pass
+
+            stdscr.refresh()
+            dirty = False
 
-        stdscr.refresh()
         key = stdscr.getch()
 
         if key == 27:
             return None
-        if key in (curses.KEY_UP, ord('w'), ord('W')):
-            cur = max(0, cur - 1)
-            msg = ""
+        if key == curses.KEY_RESIZE:
+            dirty = True
+        elif key in (curses.KEY_UP, ord('w'), ord('W')):
+            cur   = max(0, cur - 1)
+            msg   = ""
+            dirty = True
         elif key in (curses.KEY_DOWN, ord('s'), ord('S')):
-            cur = min(len(sites) - 1, cur + 1)
-            msg = ""
+            cur   = min(len(sites) - 1, cur + 1)
+            msg   = ""
+            dirty = True
         elif key in (curses.KEY_ENTER, 10, 13):
             site = sites[cur]
             if player.fuel < site.fuel_cost:
-                msg = f"Not enough fuel. Need {site.fuel_cost}, have {player.fuel}."
+                msg   = f"Not enough fuel. Need {site.fuel_cost}, have {player.fuel}."
+                dirty = True
             else:
                 return site
@@ -1,8 +1,10 @@
 """Dungeon generation, scatter functions, FOV, A*, effects — zero curses."""
 
+import array
 import collections
-import copy
-import heapq
+import functools
+import itertools
+import math
 import random
 
 from .constants import *
@@ -46,21 +48,35 @@ THEME_DATA = {
 }
 
 
+# Floor number → theme, flattened once from THEME_DATA (index 0 unused)
+_THEME_BY_FLOOR = [None] + [data for (lo, hi), data in THEME_DATA.items()
+                            for _ in range(lo, hi + 1)]
+
+
 def get_theme(floor_num):
-    for (lo, hi), data in THEME_DATA.items():
-        if lo <= floor_num <= hi:
-            return data
-    return list(THEME_DATA.values())[-1]  # fallback to deepest theme
+    if 1 <= floor_num < len(_THEME_BY_FLOOR):
+        return _THEME_BY_FLOOR[floor_num]
+    return _THEME_BY_FLOOR[-1]  # fallback to deepest theme
+
+
+def find_floor_cells(tiles):
+    """All (x, y) FLOOR positions on a dungeon map, row by row."""
+    return [(x, y) for y, row in enumerate(tiles) for x, ch in enumerate(row) if ch == FLOOR]
 
 
-def scatter_enemies(tiles, floor_num, n, exclude=(), weights=None):
-    floors = [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-              if tiles[y][x] == FLOOR and (x, y) not in exclude]
-    positions = random.sample(floors, min(n, len(floors)))
+def reveal_rect(tiles, explored, cx, cy, r):
+    """Add every FLOOR tile within Chebyshev distance r of (cx, cy) to explored."""
+    x0, x1 = max(0, cx - r), min(MAP_W, cx + r + 1)
+    for y in range(max(0, cy - r), min(MAP_H, cy + r + 1)):
+        row = tiles[y]
+        explored.update((x, y) for x in range(x0, x1) if row[x] == FLOOR)
+
+
+def scatter_enemies(positions, floor_num, cum_weights=None):
+    templates = random.choices(ENEMY_TEMPLATES, cum_weights=cum_weights, k=len(positions))
     scale = 1 + (floor_num - 1) * 0.2   # +20% stats per floor
     result = {}
-    for pos in positions:
-        t = random.choices(ENEMY_TEMPLATES, weights=weights)[0]
+    for pos, t in zip(positions, templates):
         result[pos] = Enemy(
             name=t['name'], char=t['char'],
             hp=max(1, int(t['hp'] * scale)),
@@ -73,55 +89,50 @@ def scatter_enemies(tiles, floor_num, n, exclude=(), weights=None):
 
 
 def generate_dungeon(max_rooms=30, min_rw=5, max_rw=12, min_rh=4, max_rh=9):
-    tiles = [[WALL] * MAP_W for _ in range(MAP_H)]
-    rooms = []
+    tiles   = [[WALL] * MAP_W for _ in range(MAP_H)]
+    rooms   = []
+    randint = random.randint
+    rand    = random.random
 
     for _ in range(max_rooms):
-        w = random.randint(min_rw, max_rw)
-        h = random.randint(min_rh, max_rh)
-        x = random.randint(1, MAP_W - w - 1)
-        y = random.randint(1, MAP_H - h - 1)
+        w = randint(min_rw, max_rw)
+        h = randint(min_rh, max_rh)
+        x = randint(1, MAP_W - w - 1)
+        y = randint(1, MAP_H - h - 1)
         room = Room(x, y, w, h)
 
         if any(room.intersects(r) for r in rooms):
             continue
 
-        # Carve the room
+        # Carve the room, one row slice at a time
+        fill = [FLOOR] * (room.x2 - room.x1)
         for ry in range(room.y1, room.y2):
-            for rx in range(room.x1, room.x2):
-                tiles[ry][rx] = FLOOR
+            tiles[ry][room.x1:room.x2] = fill
 
-        # Carve a corridor to the previous room
+        # Carve a corridor to the previous room: the horizontal leg is one
+        # row slice, the vertical leg one cell per row
         if rooms:
             cx1, cy1 = room.center()
             cx2, cy2 = rooms[-1].center()
-            if random.random() < 0.5:
-                for rx in range(min(cx1, cx2), max(cx1, cx2) + 1):
-                    tiles[cy1][rx] = FLOOR
-                for ry in range(min(cy1, cy2), max(cy1, cy2) + 1):
-                    tiles[ry][cx2] = FLOOR
+            lo_x, hi_x = min(cx1, cx2), max(cx1, cx2) + 1
+            if rand() < 0.5:
+                row_y, col_x = cy1, cx2
             else:
-                for ry in range(min(cy1, cy2), max(cy1, cy2) + 1):
-                    tiles[ry][cx1] = FLOOR
-                for rx in range(min(cx1, cx2), max(cx1, cx2) + 1):
-                    tiles[cy2][rx] = FLOOR
+                row_y, col_x = cy2, cx1
+            tiles[row_y][lo_x:hi_x] = [FLOOR] * (hi_x - lo_x)
+            for ry in range(min(cy1, cy2), max(cy1, cy2) + 1):
+                tiles[ry][col_x] = FLOOR
 
         rooms.append(room)
 
     return tiles, rooms
 
 
-def scatter_items(tiles, n=6, exclude=()):
-    floors = [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-              if tiles[y][x] == FLOOR and (x, y) not in exclude]
-    positions = random.sample(floors, min(n, len(floors)))
-    return {pos: copy.copy(random.choice(ITEM_TEMPLATES)) for pos in positions}
+def scatter_items(positions):
+    return {pos: random.choice(ITEM_TEMPLATES).clone() for pos in positions}
 
 
-def scatter_terminals(tiles, n=2, exclude=(), floor_num=1):
-    floors = [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-              if tiles[y][x] == FLOOR and (x, y) not in exclude]
-    positions = random.sample(floors, min(n, len(floors)))
+def scatter_terminals(positions, floor_num=1):
     result = {}
     for i, pos in enumerate(positions):
         if i % 2 == 0:
@@ -134,18 +145,17 @@ def scatter_terminals(tiles, n=2, exclude=(), floor_num=1):
     return result
 
 
-def scatter_hazards(tiles, floor_num, n=0, exclude=()):
-    """Place hazard tiles. Returns {(x,y): hazard_dict} or {} if n=0."""
-    if n <= 0:
+_HAZARD_TYPES = ('mine', 'acid', 'electric')
+_HAZARD_CUM   = tuple(itertools.accumulate((40, 30, 30)))
+
+
+def scatter_hazards(positions):
+    """Place hazard tiles. Returns {(x,y): hazard_dict} or {} if no positions."""
+    if not positions:
         return {}
-    hazard_types   = ['mine', 'acid', 'electric']
-    hazard_weights = [40, 30, 30]
-    floors    = [(x, y) for y in range(MAP_H) for x in range(MAP_W)
-                 if tiles[y][x] == FLOOR and (x, y) not in exclude]
-    positions = random.sample(floors, min(n, len(floors)))
+    htypes    = random.choices(_HAZARD_TYPES, cum_weights=_HAZARD_CUM, k=len(positions))
     result = {}
-    for pos in positions:
-        htype = random.choices(hazard_types, weights=hazard_weights)[0]
+    for pos, htype in zip(positions, htypes):
         hdata = HAZARD_DATA[htype]
         result[pos] = {
             'type':          htype,
@@ -184,7 +194,7 @@ def scatter_special_rooms(tiles, rooms, floor_num, is_final=False):
         spec = {'type': rtype, 'tiles': room_tiles, 'triggered': False}
         if rtype == 'shop':
             sample_size = min(7, len(SHOP_STOCK))
-            spec['stock'] = [(copy.copy(item), price)
+            spec['stock'] = [(item.clone(), price)
                              for item, price in random.sample(SHOP_STOCK, sample_size)]
         specials[i] = spec
 
@@ -192,9 +202,11 @@ def scatter_special_rooms(tiles, rooms, floor_num, is_final=False):
 
 
 def make_floor(floor_num, theme_fn=None, enemy_density=1.0, is_final=False, place_boss=False):
+    invalidate_fov()
     theme_fn = theme_fn or get_theme
     theme    = theme_fn(floor_num)
     tiles, rooms = generate_dungeon(**theme['gen'])
+    floor_cells  = find_floor_cells(tiles)   # one scan shared by every scatter_*
     if rooms:
         start = rooms[0].center()
     else:
@@ -204,53 +216,51 @@ def make_floor(floor_num, theme_fn=None, enemy_density=1.0, is_final=False, plac
     stair_down = None if is_final else (rooms[-1].center() if rooms else start)
 
     exclude_set = {stair_up, stair_down, start} - {None}
-    n_enemies = int((3 + floor_num * 2) * enemy_density)
-    if n_enemies > 0:
-        enemies = scatter_enemies(tiles, floor_num, n=n_enemies,
-                                  exclude=exclude_set, weights=theme['weights'])
-    else:
-        enemies = {}
-
-    # Boss floor: place the boss in the last room
-    if place_boss and rooms:
-        boss_pos = rooms[-1].center()
-        scale    = 1 + (floor_num - 1) * 0.2
-        enemies[boss_pos] = Enemy(
-            name='HADES-7 Remnant', char='H',
-            hp=int(100 * scale), atk=int(12 * scale), dfn=int(3 * scale),
-            xp_reward=500, boss=True,
-        )
-        exclude_set = exclude_set | {boss_pos}
-
-    items     = scatter_items(tiles, exclude=exclude_set | set(enemies.keys()))
-    terminals = scatter_terminals(tiles, exclude=exclude_set | set(enemies.keys()),
-                                  floor_num=floor_num)
+    boss_pos    = rooms[-1].center() if place_boss and rooms else None
+    if boss_pos is not None:
+        exclude_set.add(boss_pos)
 
+    # Special rooms are safe zones, so pick them first and keep everything out
     special_rooms = scatter_special_rooms(tiles, rooms, floor_num, is_final=is_final)
-
-    # Clear enemies/items/terminals from special room tiles (safe zones)
-    all_special_tiles: set = set()
     for sr in special_rooms.values():
-        all_special_tiles |= sr['tiles']
-    for pos in list(enemies.keys()):
-        if pos in all_special_tiles:
-            del enemies[pos]
-    for pos in list(items.keys()):
-        if pos in all_special_tiles:
-            del items[pos]
-    for pos in list(terminals.keys()):
-        if pos in all_special_tiles:
-            del terminals[pos]
+        exclude_set |= sr['tiles']
 
+    n_enemies   = max(0, int((3 + floor_num * 2) * enemy_density))
+    n_items     = 6
+    n_terminals = 2
     if floor_num <= 2:
         n_hazards = 0
     elif floor_num <= 5:
         n_hazards = random.randint(0, 2)
     else:
         n_hazards = random.randint(1, 3)
-    hazards = scatter_hazards(
-        tiles, floor_num, n=n_hazards,
-        exclude=exclude_set | set(enemies) | set(items) | all_special_tiles)
+
+    # One sample covers every category; slicing keeps the positions disjoint.
+    # Sample indices into floor_cells, with enough spare to cover every
+    # excluded cell, rather than building a filtered copy of the whole list.
+    total      = n_enemies + n_items + n_terminals + n_hazards
+    n_cells    = len(floor_cells)
+    idxs       = random.sample(range(n_cells), min(total + len(exclude_set), n_cells))
+    picks      = [floor_cells[i] for i in idxs if floor_cells[i] not in exclude_set][:total]
+    i_items    = n_enemies
+    i_terms    = i_items + n_items
+    i_hazards  = i_terms + n_terminals
+
+    enemies = scatter_enemies(picks[:i_items], floor_num,
+                              cum_weights=list(itertools.accumulate(theme['weights'])))
+
+    # Boss floor: place the boss in the last room
+    if boss_pos is not None:
+        scale = 1 + (floor_num - 1) * 0.2
+        enemies[boss_pos] = Enemy(
+            name='HADES-7 Remnant', char='H',
+            hp=int(100 * scale), atk=int(12 * scale), dfn=int(3 * scale),
+            xp_reward=500, boss=True,
+        )
+
+    items     = scatter_items(picks[i_items:i_terms])
+    terminals = scatter_terminals(picks[i_terms:i_hazards], floor_num=floor_num)
+    hazards   = scatter_hazards(picks[i_hazards:])
 
     return {
         'tiles':         tiles,
@@ -263,6 +273,7 @@ def make_floor(floor_num, theme_fn=None, enemy_density=1.0, is_final=False, plac
         'explored':      set(),
         'special_rooms': special_rooms,
         'hazards':       hazards,
+        'floor_cells':   floor_cells,
     }
 
 
@@ -379,6 +390,9 @@ _POI_SPECS = {
 
 # ── Overland terrain helpers ──────────────────────────────────────────────────
 
+_DIRS8 = ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
 def _grow_terrain(tiles, char, total, n_seeds=None):
     """Grow terrain regions via random walk to create large sweeping features."""
     if total <= 0:
@@ -386,20 +400,26 @@ def _grow_terrain(tiles, char, total, n_seeds=None):
     if n_seeds is None:
         n_seeds = max(2, total // 12)
     per_seed = max(1, total // n_seeds)
+    choice   = random.choice
+    randint  = random.randint
+    dirs     = _DIRS8
+    max_x, max_y = MAP_W - 2, MAP_H - 2
     for _ in range(n_seeds):
-        x = random.randint(2, MAP_W - 3)
-        y = random.randint(2, MAP_H - 3)
+        # Seeds start inside the border and every step is clamped back into
+        # 1..MAP-2, so the walk never needs a separate bounds test.
+        x = randint(2, MAP_W - 3)
+        y = randint(2, MAP_H - 3)
         placed = 0
         for _step in range(per_seed * 6):
-            if 1 <= x < MAP_W - 1 and 1 <= y < MAP_H - 1:
-                if tiles[y][x] != char:
-                    tiles[y][x] = char
-                    placed += 1
-                    if placed >= per_seed:
-                        break
-            dx, dy = random.choice([(0,1),(0,-1),(1,0),(-1,0),(1,1),(1,-1),(-1,1),(-1,-1)])
-            x = max(1, min(MAP_W - 2, x + dx))
-            y = max(1, min(MAP_H - 2, y + dy))
+            row = tiles[y]
+            if row[x] != char:
+                row[x] = char
+                placed += 1
+                if placed >= per_seed:
+                    break
+            dx, dy = choice(dirs)
+            x = max(1, min(max_x, x + dx))
+            y = max(1, min(max_y, y + dy))
 
 
 def _clear_area(tiles, cx, cy, radius, fill):
@@ -414,17 +434,21 @@ def _clear_area(tiles, cx, cy, radius, fill):
 def _find_open_pos(tiles, x1, y1, x2, y2, avoid, min_dist=10):
     """Return an open tile within the rectangle [x1,x2]×[y1,y2] that is at
     least min_dist from every position in avoid."""
+    randint = random.randint
     for _ in range(400):
-        x = random.randint(x1, x2)
-        y = random.randint(y1, y2)
+        x = randint(x1, x2)
+        y = randint(y1, y2)
         if tiles[y][x] in OV_IMPASSABLE:
             continue
-        if all(abs(x - ax) + abs(y - ay) >= min_dist for ax, ay in avoid):
+        for ax, ay in avoid:
+            if abs(x - ax) + abs(y - ay) < min_dist:
+                break   # too close to something already placed
+        else:
             return (x, y)
     # Fallback: relax distance constraint
     for _ in range(100):
-        x = random.randint(x1, x2)
-        y = random.randint(y1, y2)
+        x = randint(x1, x2)
+        y = randint(y1, y2)
         if tiles[y][x] not in OV_IMPASSABLE:
             return (x, y)
     return ((x1 + x2) // 2, (y1 + y2) // 2)
@@ -528,49 +552,98 @@ def generate_overland(site_name):
     }
 
 
+# A* scratch buffers indexed by y * MAP_W + x, reset by slice copy per search
+_PATH_INF     = 1 << 30
+_G_RESET      = array.array('i', [_PATH_INF]) * (MAP_W * MAP_H)
+_CAME_RESET   = array.array('i', [-1]) * (MAP_W * MAP_H)
+_CLOSED_RESET = array.array('b', [0]) * (MAP_W * MAP_H)
+_g_score      = array.array('i', _G_RESET)
+_came_from    = array.array('i', _CAME_RESET)
+_closed       = array.array('b', _CLOSED_RESET)
+
+# Walkability of the last map searched: (tiles, bytes of 1/0 per cell)
+_walk_cache = (None, None)
+
+
+def _walkable(tiles):
+    """Flat bytes, 1 where tiles is FLOOR, indexed y * MAP_W + x (last map cached).
+    The first and last columns read as 0 and a row of 0s is appended, so
+    stepping off any edge by a flat-index delta lands on a 0 (negative
+    indices wrap into the padding). Dungeon floors never touch the border."""
+    global _walk_cache
+    if _walk_cache[0] is not tiles:
+        walk = bytearray(ch == FLOOR for row in tiles for ch in row)
+        walk[0::MAP_W]         = bytes(MAP_H)
+        walk[MAP_W - 1::MAP_W] = bytes(MAP_H)
+        walk += bytes(MAP_W)
+        _walk_cache = (tiles, bytes(walk))
+    return _walk_cache[1]
+
+
+_DELTA = (-MAP_W, MAP_W, -1, 1)   # up, down, left, right as flat-index steps
+
+
 def find_path(tiles, start, goal, blocked):
     """A* on the floor grid. blocked: set of (x,y) that cannot be entered.
-    goal is always reachable even if in blocked (so enemies can attack the player).
+    goal is always reachable even if in blocked (so enemies can attack the player),
+    and start may be in blocked (it is never re-entered).
     Returns a list of (x,y) steps not including start, or [] if unreachable."""
     if start == goal:
         return []
 
-    def h(pos):
-        return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
-
-    open_heap = [(h(start), 0, start)]
-    came_from = {start: None}
-    g_score   = {start: 0}
-
-    while open_heap:
-        _, g, pos = heapq.heappop(open_heap)
+    W        = MAP_W
+    gx, gy   = goal
+    s_idx    = start[1] * W + start[0]
+    g_idx    = gy * W + gx
+    g_score  = _g_score
+    came     = _came_from
+    closed   = _closed
+    walk     = _walkable(tiles)
+    blocked  = {y * W + x for x, y in blocked}
+    g_score[:] = _G_RESET
+    came[:]    = _CAME_RESET
+    closed[:]  = _CLOSED_RESET
+    g_score[s_idx] = 0
+
+    # Bucket queue: step costs are 1 and Manhattan distance is consistent, so
+    # f never drops below the bucket being drained. Buckets are offset by the
+    # start's f and grow on demand; each holds packed cell indices.
+    f0      = abs(start[0] - gx) + abs(start[1] - gy)
+    buckets = [[s_idx]]
+    cur     = 0
+    while cur < len(buckets):
+        bucket = buckets[cur]
+        if not bucket:
+            cur += 1
+            continue
+        idx = bucket.pop()
+        if closed[idx]:
+            continue
+        closed[idx] = 1
 
-        if pos == goal:
-            path, cur = [], pos
-            while cur != start:
-                path.append(cur)
-                cur = came_from[cur]
+        if idx == g_idx:
+            path = []
+            while idx != s_idx:
+                path.append((idx % W, idx // W))
+                idx = came[idx]
             path.reverse()
             return path
 
-        if g > g_score.get(pos, float('inf')):
-            continue
-
-        x, y = pos
-        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-            nx, ny = x + dx, y + dy
-            npos   = (nx, ny)
-            if not (0 <= nx < MAP_W and 0 <= ny < MAP_H):
-                continue
-            if tiles[ny][nx] != FLOOR:
+        ng = g_score[idx] + 1
+        for d in _DELTA:
+            nidx = idx + d
+            if not walk[nidx]:   # also rejects every off-map step
                 continue
-            if npos in blocked and npos != goal:
+            if nidx != g_idx and nidx in blocked:
                 continue
-            ng = g + 1
-            if ng < g_score.get(npos, float('inf')):
-                g_score[npos]   = ng
-                came_from[npos] = pos
-                heapq.heappush(open_heap, (ng + h(npos), ng, npos))
+            if ng < g_score[nidx]:
+                g_score[nidx] = ng
+                came[nidx]    = idx
+                ny, nx = divmod(nidx, W)
+                f = ng + abs(nx - gx) + abs(ny - gy) - f0
+                while len(buckets) <= f:
+                    buckets.append([])
+                buckets[f].append(nidx)
 
     return []
 
@@ -594,25 +667,114 @@ def _bresenham(x0, y0, x1, y1):
             y0  += sy
 
 
+# Bresenham lines depend only on the (dx, dy) offset, so trace them once from
+# the origin. Pre-filled for everything within FOV_RADIUS; others on demand.
+_RAYS = {(dx, dy): tuple(_bresenham(0, 0, dx, dy))[1:]
+         for dy in range(-FOV_RADIUS, FOV_RADIUS + 1)
+         for dx in range(-FOV_RADIUS, FOV_RADIUS + 1)
+         if dx * dx + dy * dy <= FOV_RADIUS * FOV_RADIUS}
+
+
+def _ray(dx, dy):
+    """Offsets along the Bresenham line from (0, 0) to (dx, dy), origin excluded."""
+    ray = _RAYS.get((dx, dy))
+    if ray is None:
+        ray = _RAYS[(dx, dy)] = tuple(_bresenham(0, 0, dx, dy))[1:]
+    return ray
+
+
+# Per-level FOV memo: (px, py, radius) -> visible, valid for the tiles list in
+# _fov_tiles. The list is held by reference so an identity check can't be
+# fooled by a recycled id(). Switching maps starts a fresh memo; anything that
+# changes which tiles block sight on the current map must call invalidate_fov().
+_FOV_MEMO_MAX = 64
+_fov_tiles    = None
+_fov_memo     = {}
+
+
+def invalidate_fov():
+    """Drop every memoized FOV result."""
+    global _fov_tiles
+    _fov_tiles = None
+    _fov_memo.clear()
+
+
 def compute_fov(tiles, px, py, radius=FOV_RADIUS):
-    """Return the set of (x, y) tiles visible from (px, py)."""
-    visible = set()
-    for dy in range(-radius, radius + 1):
-        for dx in range(-radius, radius + 1):
-            if dx * dx + dy * dy > radius * radius:
-                continue
-            tx, ty = px + dx, py + dy
-            if not (0 <= tx < MAP_W and 0 <= ty < MAP_H):
-                continue
-            for rx, ry in _bresenham(px, py, tx, ty):
-                if not (0 <= rx < MAP_W and 0 <= ry < MAP_H):
-                    break
-                visible.add((rx, ry))
-                if tiles[ry][rx] == WALL:
-                    break  # wall is visible but blocks further sight
+    """Return the frozenset of (x, y) tiles visible from (px, py).
+    Results are memoized per map by (px, py, radius), so waiting turns,
+    revisited cells and flicker-radius redraws skip the sweep.
+
+    Symmetric shadowcasting: each quadrant is swept row by row outward from
+    the viewer, tracking spans between a start and end slope. Slopes are
+    integer fractions (num, den) so the symmetry test is exact. Floor tiles
+    are lit only if their centre lies inside a span, which makes sight
+    symmetric; walls are lit if any part is. Tiles off the map block sight
+    and are never lit."""
+    global _fov_tiles
+    if tiles is not _fov_tiles:
+        _fov_tiles = tiles
+        _fov_memo.clear()
+    key = (px, py, radius)
+    if key in _fov_memo:
+        return _fov_memo[key]
+    visible = {(px, py)}
+    add     = visible.add
+    widths  = _disk_widths(radius)
+    spans   = collections.deque()
+    for cx, dx, cy, dy in _QUADRANTS:
+        # Spans are (depth, sn, sd, en, ed), drained in row order. A span is
+        # only queued if its row is within radius, so the quadrant ends as
+        # soon as everything left is in shadow.
+        if radius >= 1:
+            spans.append((1, -1, 1, 1, 1))
+        while spans:
+            depth, sn, sd, en, ed = spans.popleft()
+            more    = depth < radius
+            min_col = (2 * depth * sn + sd) // (2 * sd)      # round, ties up
+            max_col = -((ed - 2 * depth * en) // (2 * ed))   # round, ties down
+            # Clip to the sight disk. The disk narrows with depth, so cells
+            # outside it can only shadow cells that are outside it too.
+            half = widths[depth]
+            if min_col < -half:
+                min_col = -half
+            if max_col > half:
+                max_col = half
+            bx = px + depth * dx
+            by = py + depth * dy
+            prev_wall = None
+            for col in range(min_col, max_col + 1):
+                mx = bx + col * cx
+                my = by + col * cy
+                inside = 0 <= mx < MAP_W and 0 <= my < MAP_H
+                wall   = not inside or tiles[my][mx] == WALL
+                if inside and (wall or (col * sd >= depth * sn and col * ed <= depth * en)):
+                    add((mx, my))
+                if prev_wall and not wall:
+                    sn, sd = 2 * col - 1, 2 * depth
+                elif prev_wall is False and wall and more:
+                    spans.append((depth + 1, sn, sd, 2 * col - 1, 2 * depth))
+                prev_wall = wall
+            if prev_wall is False and more:
+                spans.append((depth + 1, sn, sd, en, ed))
+    if len(_fov_memo) >= _FOV_MEMO_MAX:
+        _fov_memo.clear()
+    visible = _fov_memo[key] = frozenset(visible)
     return visible
 
 
+@functools.lru_cache(maxsize=None)
+def _disk_widths(radius):
+    """Half-width of the sight disk at each depth 0..radius: the largest col
+    with col² + depth² <= radius²."""
+    return tuple(math.isqrt(radius * radius - d * d) for d in range(radius + 1))
+
+
+# Quadrant transforms (cx, dx, cy, dy): map x = ox + col*cx + depth*dx,
+# map y = oy + col*cy + depth*dy. North and south walk along rows of tiles
+# and run first, back to back; then east and west.
+_QUADRANTS = ((1, 0, 0, -1), (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0))
+
+
 def apply_effect(entity, effect, turns):
     """Apply or refresh a status effect (keeps max remaining turns).
     Player's Survival skill reduces duration by 1 per skill level (min 1)."""
@@ -623,9 +785,10 @@ def apply_effect(entity, effect, turns):
 
 def tick_effects(entity, label):
     """Tick active effects one turn. Returns list of message strings."""
-    msgs = []
-    expired = []
-    for effect, turns in list(entity.active_effects.items()):
+    msgs      = []
+    expired   = []
+    remaining = {}
+    for effect, turns in entity.active_effects.items():
         if effect in EFFECT_DAMAGE:
             dmg = EFFECT_DAMAGE[effect]
             entity.hp -= dmg
@@ -635,11 +798,12 @@ def tick_effects(entity, label):
                 heal = min(5, entity.max_hp - entity.hp)
                 entity.hp += heal
                 msgs.append(f"Repair Drone: +{heal} HP.")
-        entity.active_effects[effect] = turns - 1
-        if turns - 1 <= 0:
+        if turns > 1:
+            remaining[effect] = turns - 1
+        else:
             expired.append(effect)
+    entity.active_effects = remaining
     for e in expired:
-        del entity.active_effects[e]
         if e == 'stim':
             apply_effect(entity, 'stun', 1)
             msgs.append(f"{label}: stimpack crash — stunned!")